@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Scope of Advice Demo
+
+Minimal example of generating the scope of advice JSON for a single automation form.
+See scope_of_advice_examples.py for a fuller walkthrough of the checkbox scenarios.
+
+Created: 2025-01-27
+Author: Insurance SOA System
+"""
+
+import json
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.processors.scope_of_advice_generator import generate_scope_of_advice_json
+
+
+if __name__ == "__main__":
+    # Example form data
+    example_data = {
+        "f5": "checked",
+        "f5.1": "Yes",  # Life Insurance
+        "f5.2": "Yes",  # Income Protection
+        "f5.3": "No",   # Trauma Cover
+        "f5.4": "No",   # Health Insurance
+        "f5.5": "Yes",  # TPD
+        "f5.6": "No",   # ACC
+        "f6": "checked",
+        "f6.1": "Yes",  # Employer medical
+        "f6.3": "Yes",  # Budget limitations
+        "f7": "Client has comprehensive medical coverage through employer's group scheme"
+    }
+
+    # Generate JSON structure
+    result = generate_scope_of_advice_json(
+        example_data,
+        client_name="John Smith",
+        is_couple=False
+    )
+
+    # Pretty print the result
+    print(json.dumps(result, indent=2))
@@ -5,6 +5,7 @@ Manual trigger script to match forms and trigger Zapier
 
 import sys
 import json
+import logging
 from pathlib import Path
 
 # Add src directory to path
@@ -17,6 +18,9 @@ from processors.auto_matcher import check_and_trigger_match
 from processors.zapier_trigger import ZapierTrigger
 
 def main():
+    # Show the Zapier trigger's progress messages on the console
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     # Get email from command line or use default
     if len(sys.argv) > 1:
         email = sys.argv[1]
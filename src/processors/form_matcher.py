@@ -63,6 +63,10 @@ class FormMatcher:
         self.fact_finds: Dict[str, FactFind] = {}  # Key: case_id or email
         self.automation_forms: Dict[str, AutomationForm] = {}  # Key: email
 
+        # Normalized email -> identifier in the dicts above (lookup index, not extra entries)
+        self._fact_find_ids_by_email: Dict[str, str] = {}
+        self._automation_form_ids_by_email: Dict[str, str] = {}
+
         # Matching history
         self.match_history: List[MatchResult] = []
 
@@ -85,10 +89,14 @@ class FormMatcher:
 
         self.fact_finds[identifier] = fact_find
 
-        # Also store by email for easy lookup
+        # Cache the form date as epoch seconds for cheap proximity checks
+        fact_find._form_date_epoch = self._date_to_epoch(fact_find.case_info.get('form_date'))
+
+        # Also index by normalized email for easy lookup
         email = fact_find.client_info.get('email')
-        if email and email != identifier:
-            self.fact_finds[email] = fact_find
+        if email:
+            fact_find._norm_email = self._normalize_email(email)
+            self._fact_find_ids_by_email[fact_find._norm_email] = identifier
 
         return identifier
 
@@ -110,8 +118,47 @@ class FormMatcher:
             raise ValueError("Cannot add automation form without email")
 
         self.automation_forms[identifier] = automation_form
+
+        # Also index by normalized email for easy lookup
+        email = automation_form.client_details.get('email')
+        if email:
+            automation_form._norm_email = self._normalize_email(email)
+            self._automation_form_ids_by_email[automation_form._norm_email] = identifier
+
+        # Cache the recommendation date as epoch seconds for cheap proximity checks
+        automation_form._rec_date_epoch = self._date_to_epoch(automation_form.additional.get('recommendation_date'))
+
         return identifier
 
+    @staticmethod
+    def _normalize_email(email: str) -> str:
+        """
+        Normalize an email for use as a lookup key
+
+        The result is lowercased, stripped and interned, so its hash is computed
+        once and dict lookups against stored keys hit the identity fast path.
+        """
+        return sys.intern(email.lower().strip())
+
+    @staticmethod
+    def _date_to_epoch(date_str: Optional[str]) -> Optional[int]:
+        """
+        Convert an ISO date string to integer epoch seconds
+
+        Args:
+            date_str: ISO formatted date string (may end in 'Z')
+
+        Returns:
+            Epoch seconds, or None if missing or unparseable
+        """
+        if not date_str:
+            return None
+
+        try:
+            return int(datetime.fromisoformat(date_str.replace('Z', '+00:00')).timestamp())
+        except (ValueError, AttributeError, OverflowError, OSError):
+            return None
+
     def match_by_email(self, email: str) -> Optional[MatchResult]:
         """
         Find matching forms by email address
@@ -122,23 +169,23 @@ class FormMatcher:
         Returns:
             MatchResult if both forms found, None otherwise
         """
-        email = email.lower().strip()
+        email = self._normalize_email(email)
 
         # Find fact find with this email
-        fact_find = self.fact_finds.get(email)
+        fact_find = self.fact_finds.get(self._fact_find_ids_by_email.get(email, email))
         if not fact_find:
             # Try to find by searching through all fact finds
             for ff in self.fact_finds.values():
-                if ff.client_info.get('email', '').lower().strip() == email:
+                if getattr(ff, '_norm_email', None) == email:
                     fact_find = ff
                     break
 
         # Find automation form with this email
-        automation_form = self.automation_forms.get(email)
+        automation_form = self.automation_forms.get(self._automation_form_ids_by_email.get(email, email))
         if not automation_form:
             # Try to find by searching through all automation forms
             for af in self.automation_forms.values():
-                if af.client_details.get('email', '').lower().strip() == email:
+                if getattr(af, '_norm_email', None) == email:
                     automation_form = af
                     break
 
@@ -229,27 +276,24 @@ class FormMatcher:
             reasons.append(f"Case ID present: {case_id}")
 
         # Timing proximity (10% weight) - forms submitted within reasonable timeframe
-        ff_date_str = fact_find.case_info.get('form_date')
-        af_date_str = automation_form.additional.get('recommendation_date')
-
-        if ff_date_str and af_date_str:
-            try:
-                ff_date = datetime.fromisoformat(ff_date_str.replace('Z', '+00:00'))
-                af_date = datetime.fromisoformat(af_date_str.replace('Z', '+00:00'))
-
-                time_diff = abs((af_date - ff_date).total_seconds())
-                days_diff = time_diff / 86400
-
-                if days_diff <= 7:  # Within a week
-                    confidence += 0.1
-                    reasons.append(f"Forms submitted {days_diff:.1f} days apart")
-                elif days_diff <= 30:  # Within a month
-                    confidence += 0.05
-                    reasons.append(f"Forms submitted {days_diff:.1f} days apart (acceptable)")
-                else:
-                    reasons.append(f"Forms submitted {days_diff:.1f} days apart (concerning)")
-            except (ValueError, AttributeError):
-                pass
+        ff_epoch = getattr(fact_find, '_form_date_epoch', None)
+        if ff_epoch is None:
+            ff_epoch = self._date_to_epoch(fact_find.case_info.get('form_date'))
+        af_epoch = getattr(automation_form, '_rec_date_epoch', None)
+        if af_epoch is None:
+            af_epoch = self._date_to_epoch(automation_form.additional.get('recommendation_date'))
+
+        if ff_epoch is not None and af_epoch is not None:
+            days_diff = abs(af_epoch - ff_epoch) / 86400.0
+
+            if days_diff <= 7:  # Within a week
+                confidence += 0.1
+                reasons.append(f"Forms submitted {days_diff:.1f} days apart")
+            elif days_diff <= 30:  # Within a month
+                confidence += 0.05
+                reasons.append(f"Forms submitted {days_diff:.1f} days apart (acceptable)")
+            else:
+                reasons.append(f"Forms submitted {days_diff:.1f} days apart (concerning)")
 
         # Existing insurance consistency check (10% weight)
         if self._check_insurance_consistency(fact_find, automation_form):
@@ -4,6 +4,7 @@ Extracts insurance quote upload URLs from automation form fields
 """
 
 import json
+from functools import lru_cache
 from typing import Dict, Any
 
 
@@ -12,21 +13,41 @@ def extract_quote_url(field_value: Any) -> str:
     Extract URL from quote field JSON format
 
     Fields contain JSON arrays like: [{"name":"filename.pdf","url":"https://..."}]
+    Already-deserialized lists/dicts (e.g. from a parsed Zapier payload) are
+    read directly without a JSON round-trip.
     """
     if not field_value:
         return ""
 
+    # Already-parsed upload data - no need to go through json.loads
+    if isinstance(field_value, list):
+        return field_value[0].get('url', '') if isinstance(field_value[0], dict) else ""
+    if isinstance(field_value, dict):
+        return field_value.get('url', '')
+
+    if isinstance(field_value, str):
+        return _extract_quote_url_str(field_value)
+
+    return ""
+
+
+@lru_cache(maxsize=4096)
+def _extract_quote_url_str(field_value: str) -> str:
+    """
+    Extract URL from a string quote field (cached - identical field strings
+    repeat heavily across forms in bulk ingestion)
+    """
     try:
-        # If it's already a string that looks like JSON, parse it
-        if isinstance(field_value, str) and field_value.startswith('['):
+        # If it's a string that looks like JSON, parse it
+        if field_value.startswith('['):
             quote_data = json.loads(field_value)
             if quote_data and len(quote_data) > 0:
                 # Get the first item's URL
                 return quote_data[0].get('url', '')
         # If it's just a plain URL string, return it
-        elif isinstance(field_value, str) and field_value.startswith('http'):
+        elif field_value.startswith('http'):
             return field_value
-    except (json.JSONDecodeError, TypeError, KeyError):
+    except (json.JSONDecodeError, TypeError, KeyError, AttributeError):
         pass
 
     return ""
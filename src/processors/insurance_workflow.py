@@ -2,18 +2,72 @@
 Insurance Workflow Processor
 Handles the complete insurance advisory workflow combining fact find and automation forms
 """
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Callable
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+import io
 import json
 from pathlib import Path
 import sys
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+    # Match the stdlib export: str() for dates and dataclasses, non-str keys converted
+    _ORJSON_EXPORT_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                              | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+except ImportError:
+    _HAS_ORJSON = False
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from models.fact_find import FactFind
 from models.automation_form import AutomationForm
 
+# Existing cover fields reported in the client summary
+_COVER_KEYS = ('life_amount', 'trauma_amount', 'income_protection_amount', 'existing_premiums')
+_COVER_DEFAULTS = dict.fromkeys(_COVER_KEYS)
+_get_cover_amounts = itemgetter(*_COVER_KEYS)
+
+# Provider quote fields as (provider, recommendation key)
+_QUOTE_FIELDS = (
+    ('Partners Life', 'quote_partners_life'),
+    ('Fidelity Life', 'quote_fidelity_life'),
+    ('AIA', 'quote_aia'),
+    ('Asteron', 'quote_asteron'),
+    ('Chubb', 'quote_chubb'),
+    ('nib', 'quote_nib'),
+)
+
+
+@lru_cache(maxsize=1024)
+def _format_dollars(value: float) -> str:
+    """Format a dollar amount with no cents (cached - amounts repeat heavily across reports)"""
+    return f"${value:,}" if isinstance(value, int) else f"${value:,.0f}"
+
+
+def _format_monthly(value: float) -> str:
+    """Format a monthly dollar amount"""
+    return _format_dollars(value) + "/month"
+
+
+# Report rows as (label, summary key, formatter), written only when the value is set
+_FINANCIAL_ROWS = (
+    ("Annual Income", 'annual_income', _format_dollars),
+    ("Home Value", 'home_value', _format_dollars),
+    ("Mortgage", 'mortgage', _format_dollars),
+    ("Total KiwiSaver", 'kiwisaver_total', _format_dollars),
+    ("Investment Properties", 'investment_properties', str),
+)
+_COVER_ROWS = (
+    ("  Life Cover", 'life', _format_dollars),
+    ("  Trauma Cover", 'trauma', _format_dollars),
+    ("  Income Protection", 'income_protection', _format_monthly),
+    ("  Current Premiums", 'total_premiums', _format_monthly),
+)
+
 
 class InsuranceWorkflow:
     """
@@ -21,12 +75,22 @@ class InsuranceWorkflow:
     Combines fact find data with recommendation/automation data
     """
 
+    __slots__ = ('fact_find', 'automation_form', 'workflow_data',
+                 '_summary_cache', '_summary_key')
+
+    # Write buffer size used when saving reports to disk
+    REPORT_BUFFER_SIZE = 64 * 1024
+
     def __init__(self):
         """Initialize the insurance workflow processor"""
         self.fact_find: Optional[FactFind] = None
         self.automation_form: Optional[AutomationForm] = None
         self.workflow_data: Dict[str, Any] = {}
 
+        # Cached client summary, keyed on the loaded form objects
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._summary_key: Optional[Tuple[int, int]] = None
+
     def load_fact_find(self, data: Dict[str, Any]) -> 'InsuranceWorkflow':
         """
         Load fact find form data
@@ -40,6 +104,7 @@ class InsuranceWorkflow:
         self.fact_find = FactFind()
         self.fact_find.load_from_dict(data)
         self.workflow_data['fact_find_loaded'] = datetime.now().isoformat()
+        self._summary_cache = None
         return self
 
     def load_automation_form(self, data: Dict[str, Any]) -> 'InsuranceWorkflow':
@@ -55,6 +120,7 @@ class InsuranceWorkflow:
         self.automation_form = AutomationForm()
         self.automation_form.load_from_dict(data)
         self.workflow_data['automation_form_loaded'] = datetime.now().isoformat()
+        self._summary_cache = None
         return self
 
     def validate_workflow(self) -> Tuple[bool, list, list]:
@@ -67,36 +133,36 @@ class InsuranceWorkflow:
         errors = []
         warnings = []
 
+        fact_find = self.fact_find
+        automation_form = self.automation_form
+        fact_find_email = fact_find.client_info.get('email') if fact_find else None
+        auto_form_email = automation_form.client_details.get('email') if automation_form else None
+
         # Check if fact find is loaded
-        if not self.fact_find:
+        if not fact_find:
             errors.append("Fact find form not loaded")
         else:
             # Validate fact find has required fields
-            if not self.fact_find.client_info.get('email'):
+            if not fact_find_email:
                 errors.append("Client email is missing from fact find")
-            if not self.fact_find.case_info.get('case_id'):
+            if not fact_find.case_info.get('case_id'):
                 warnings.append("Case ID is missing from fact find")
 
         # Check if automation form is loaded
-        if not self.automation_form:
+        if not automation_form:
             warnings.append("Automation form not loaded - recommendation data unavailable")
-        else:
+        elif not auto_form_email:
             # Validate automation form has required fields
-            if not self.automation_form.client_details.get('email'):
-                warnings.append("Client email is missing from automation form")
+            warnings.append("Client email is missing from automation form")
 
         # Cross-validate if both forms are loaded
-        if self.fact_find and self.automation_form:
+        if fact_find and automation_form:
             # Check email consistency
-            fact_find_email = self.fact_find.client_info.get('email')
-            auto_form_email = self.automation_form.client_details.get('email')
             if fact_find_email and auto_form_email and fact_find_email != auto_form_email:
                 warnings.append(f"Email mismatch: Fact find has {fact_find_email}, automation has {auto_form_email}")
 
             # Check couple status consistency
-            fact_find_couple = self.fact_find.is_couple()
-            auto_form_couple = self.automation_form.is_couple()
-            if fact_find_couple != auto_form_couple:
+            if fact_find.is_couple() != automation_form.is_couple():
                 warnings.append(f"Couple status mismatch between forms")
 
         is_valid = len(errors) == 0
@@ -106,86 +172,112 @@ class InsuranceWorkflow:
         """
         Get a comprehensive client summary combining both forms
 
+        Always built fresh from the current form data, so callers may modify
+        the result and see in-place edits to the loaded forms.
+
         Returns:
             Dictionary containing client summary
         """
-        summary = {
-            'client_info': {},
-            'financial_position': {},
-            'insurance_needs': {},
-            'recommendations': {}
-        }
+        return self._build_client_summary()
+
+    def _cached_client_summary(self) -> Dict[str, Any]:
+        """
+        Return the cached client summary for internal read-only use (do not mutate)
+
+        Shared by generate_report and to_json, so exporting both builds the summary
+        once. Rebuilt when a form is loaded or swapped out; in-place edits to a
+        loaded form are not detected, so reload the form after changing it.
+        """
+        key = (id(self.fact_find), id(self.automation_form))
+        if self._summary_cache is None or self._summary_key != key:
+            self._summary_cache = self._build_client_summary()
+            self._summary_key = key
+        return self._summary_cache
+
+    def _build_client_summary(self) -> Dict[str, Any]:
+        """Build the client summary from the loaded forms"""
+        client_summary = financial_position = insurance_needs = recommendations = None
+        existing_insurance = None
+
+        fact_find = self.fact_find
+        if fact_find:
+            client_info = fact_find.client_info
+            employment_main = fact_find.employment_main
+            household_info = fact_find.household_info
+            is_couple = fact_find.is_couple()
 
-        if self.fact_find:
             # Client information
-            summary['client_info'] = {
-                'name': self.fact_find.get_client_full_name(),
-                'email': self.fact_find.client_info.get('email'),
-                'date_of_birth': self.fact_find.client_info.get('date_of_birth'),
-                'occupation': self.fact_find.employment_main.get('occupation') or self.fact_find.client_info.get('occupation'),
-                'is_couple': self.fact_find.is_couple()
+            client_summary = {
+                'name': fact_find.get_client_full_name(),
+                'email': client_info.get('email'),
+                'date_of_birth': client_info.get('date_of_birth'),
+                'occupation': employment_main.get('occupation') or client_info.get('occupation'),
+                'is_couple': is_couple
             }
 
-            if self.fact_find.is_couple():
-                summary['client_info']['partner_name'] = self.fact_find.get_partner_full_name()
+            if is_couple:
+                client_summary['partner_name'] = fact_find.get_partner_full_name()
 
             # Financial position
-            summary['financial_position'] = {
-                'annual_income': self.fact_find.employment_main.get('annual_income'),
-                'home_value': self.fact_find.household_info.get('current_house_value'),
-                'mortgage': self.fact_find.household_info.get('current_mortgage'),
+            financial_position = {
+                'annual_income': employment_main.get('annual_income'),
+                'home_value': household_info.get('current_house_value'),
+                'mortgage': household_info.get('current_mortgage'),
                 'kiwisaver_total': self._calculate_total_kiwisaver(),
-                'investment_properties': len([k for k in self.fact_find.investment_properties.keys() if 'property_' in k and '_value' in k])
+                'investment_properties': sum(1 for k in fact_find.investment_properties if k.startswith('property_') and k.endswith('_value'))
             }
 
             # Insurance needs from fact find
-            summary['insurance_needs'] = {
-                'life_needs': self.fact_find.needs_life_main.get('total_cover'),
-                'trauma_needs': self.fact_find.needs_trauma_main.get('total'),
-                'income_protection_needs': self.fact_find.needs_income_main.get('max_insurable_income')
+            insurance_needs = {
+                'life_needs': fact_find.needs_life_main.get('total_cover'),
+                'trauma_needs': fact_find.needs_trauma_main.get('total'),
+                'income_protection_needs': fact_find.needs_income_main.get('max_insurable_income')
             }
 
-        if self.automation_form:
+        automation_form = self.automation_form
+        if automation_form:
             # Recommendations
-            summary['recommendations'] = {
-                'selected_provider': self.automation_form.get_recommended_provider(),
-                'scope_of_advice': self.automation_form.get_selected_scope(),
-                'limitations': self.automation_form.get_limitation_reasons(),
+            recommendations = {
+                'selected_provider': automation_form.get_recommended_provider(),
+                'scope_of_advice': automation_form.get_selected_scope(),
+                'limitations': automation_form.get_limitation_reasons(),
                 'quotes': self._get_all_quotes()
             }
 
-            # Update existing insurance info
-            summary['existing_insurance'] = {
-                'main': {
-                    'life': self.automation_form.main_existing_cover.get('life_amount'),
-                    'trauma': self.automation_form.main_existing_cover.get('trauma_amount'),
-                    'income_protection': self.automation_form.main_existing_cover.get('income_protection_amount'),
-                    'total_premiums': self.automation_form.main_existing_cover.get('existing_premiums')
-                }
+            # Existing insurance info
+            existing_insurance = {
+                'main': self._summarize_cover(automation_form.main_existing_cover)
             }
 
-            if self.automation_form.is_couple():
-                summary['existing_insurance']['partner'] = {
-                    'life': self.automation_form.partner_existing_cover.get('life_amount'),
-                    'trauma': self.automation_form.partner_existing_cover.get('trauma_amount'),
-                    'income_protection': self.automation_form.partner_existing_cover.get('income_protection_amount'),
-                    'total_premiums': self.automation_form.partner_existing_cover.get('existing_premiums')
-                }
+            if automation_form.is_couple():
+                existing_insurance['partner'] = self._summarize_cover(automation_form.partner_existing_cover)
 
-        return summary
+        return {
+            'client_info': client_summary or {},
+            'financial_position': financial_position or {},
+            'insurance_needs': insurance_needs or {},
+            'recommendations': recommendations or {},
+            **({'existing_insurance': existing_insurance} if existing_insurance else {})
+        }
+
+    @staticmethod
+    def _summarize_cover(cover: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize an existing cover section, fetching all amounts in one call"""
+        life, trauma, income_protection, total_premiums = _get_cover_amounts({**_COVER_DEFAULTS, **cover})
+        return {
+            'life': life,
+            'trauma': trauma,
+            'income_protection': income_protection,
+            'total_premiums': total_premiums
+        }
 
     def _calculate_total_kiwisaver(self) -> Optional[float]:
         """Calculate total KiwiSaver balance"""
         if not self.fact_find:
             return None
 
-        total = 0
-        if self.fact_find.kiwisaver.get('main_balance'):
-            total += self.fact_find.kiwisaver['main_balance']
-        if self.fact_find.kiwisaver.get('partner_balance'):
-            total += self.fact_find.kiwisaver['partner_balance']
-        if self.fact_find.kiwisaver.get('balance_3'):
-            total += self.fact_find.kiwisaver['balance_3']
+        kiwisaver = self.fact_find.kiwisaver
+        total = (kiwisaver.get('main_balance') or 0) + (kiwisaver.get('partner_balance') or 0) + (kiwisaver.get('balance_3') or 0)
 
         return total if total > 0 else None
 
@@ -195,161 +287,177 @@ class InsuranceWorkflow:
             return {}
 
         quotes = {}
-        quote_fields = {
-            'Partners Life': 'quote_partners_life',
-            'Fidelity Life': 'quote_fidelity_life',
-            'AIA': 'quote_aia',
-            'Asteron': 'quote_asteron',
-            'Chubb': 'quote_chubb',
-            'nib': 'quote_nib'
-        }
+        get = self.automation_form.recommendation.get
 
-        for provider, field in quote_fields.items():
-            value = self.automation_form.recommendation.get(field)
+        for provider, field in _QUOTE_FIELDS:
+            value = get(field)
             if value:
                 quotes[provider] = value
 
         return quotes
 
-    def generate_report(self, output_path: Optional[str] = None) -> str:
+    def generate_report(self, output_path: Optional[str] = None, return_string: bool = True) -> str:
         """
         Generate a comprehensive report combining both forms
 
         Args:
             output_path: Optional path to save the report
+            return_string: Whether to return the report content. Only takes
+                effect together with output_path: the report is then streamed
+                straight to the file without building the full string in memory.
+                Without output_path the report is always returned.
 
         Returns:
-            Report content as string
+            Report content as string (empty string if return_string is False
+            and output_path is given)
         """
-        summary = self.get_client_summary()
+        if output_path:
+            output_file = Path(output_path)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+
+            if not return_string:
+                with output_file.open('w', encoding='utf-8', newline='', buffering=self.REPORT_BUFFER_SIZE) as f:
+                    self._write_report(f.write)
+                return ""
 
-        report_lines = [
-            "=" * 70,
-            "INSURANCE ADVISORY REPORT",
-            "=" * 70,
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            ""
-        ]
+        buf = io.StringIO()
+        self._write_report(buf.write)
+        report_content = buf.getvalue()
+
+        # Save to file if path provided
+        if output_path:
+            with output_file.open('wb', buffering=self.REPORT_BUFFER_SIZE) as f:
+                f.write(report_content.encode('utf-8'))
+
+        return report_content
+
+    def _write_report(self, write: Callable[[str], Any]):
+        """
+        Write the report content through the given write function
+
+        Args:
+            write: Callable accepting each chunk of report text
+        """
+        summary = self._cached_client_summary()
+        client_info = summary['client_info']
+
+        write("=" * 70 + "\n")
+        write("INSURANCE ADVISORY REPORT\n")
+        write("=" * 70 + "\n")
+        write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
         # Client Information Section
-        report_lines.extend([
-            "CLIENT INFORMATION",
-            "-" * 50,
-            f"Name: {summary['client_info'].get('name', 'N/A')}",
-            f"Email: {summary['client_info'].get('email', 'N/A')}",
-            f"Date of Birth: {summary['client_info'].get('date_of_birth', 'N/A')}",
-            f"Occupation: {summary['client_info'].get('occupation', 'N/A')}",
-            f"Application Type: {'Couple' if summary['client_info'].get('is_couple') else 'Single'}",
-        ])
+        write("CLIENT INFORMATION\n")
+        write("-" * 50 + "\n")
+        write(f"Name: {client_info.get('name', 'N/A')}\n")
+        write(f"Email: {client_info.get('email', 'N/A')}\n")
+        write(f"Date of Birth: {client_info.get('date_of_birth', 'N/A')}\n")
+        write(f"Occupation: {client_info.get('occupation', 'N/A')}\n")
+        write(f"Application Type: {'Couple' if client_info.get('is_couple') else 'Single'}\n")
 
-        if summary['client_info'].get('partner_name'):
-            report_lines.append(f"Partner: {summary['client_info']['partner_name']}")
+        if client_info.get('partner_name'):
+            write(f"Partner: {client_info['partner_name']}\n")
 
-        report_lines.append("")
+        write("\n")
 
         # Financial Position Section
-        if summary['financial_position']:
-            report_lines.extend([
-                "FINANCIAL POSITION",
-                "-" * 50
-            ])
-
-            fin_pos = summary['financial_position']
-            if fin_pos.get('annual_income'):
-                report_lines.append(f"Annual Income: ${fin_pos['annual_income']:,.0f}")
-            if fin_pos.get('home_value'):
-                report_lines.append(f"Home Value: ${fin_pos['home_value']:,.0f}")
-            if fin_pos.get('mortgage'):
-                report_lines.append(f"Mortgage: ${fin_pos['mortgage']:,.0f}")
-            if fin_pos.get('kiwisaver_total'):
-                report_lines.append(f"Total KiwiSaver: ${fin_pos['kiwisaver_total']:,.0f}")
-            if fin_pos.get('investment_properties'):
-                report_lines.append(f"Investment Properties: {fin_pos['investment_properties']}")
-
-            report_lines.append("")
+        fin_pos = summary['financial_position']
+        if fin_pos:
+            write("FINANCIAL POSITION\n")
+            write("-" * 50 + "\n")
+            self._write_report_rows(write, fin_pos, _FINANCIAL_ROWS)
+            write("\n")
 
         # Existing Insurance Section
-        if summary.get('existing_insurance'):
-            report_lines.extend([
-                "EXISTING INSURANCE",
-                "-" * 50
-            ])
-
-            if 'main' in summary['existing_insurance']:
-                main_ins = summary['existing_insurance']['main']
-                report_lines.append("Main Contact:")
-                if main_ins.get('life'):
-                    report_lines.append(f"  Life Cover: ${main_ins['life']:,.0f}")
-                if main_ins.get('trauma'):
-                    report_lines.append(f"  Trauma Cover: ${main_ins['trauma']:,.0f}")
-                if main_ins.get('income_protection'):
-                    report_lines.append(f"  Income Protection: ${main_ins['income_protection']:,.0f}/month")
-                if main_ins.get('total_premiums'):
-                    report_lines.append(f"  Current Premiums: ${main_ins['total_premiums']:,.0f}/month")
-
-            if 'partner' in summary['existing_insurance']:
-                partner_ins = summary['existing_insurance']['partner']
-                report_lines.append("\nPartner:")
-                if partner_ins.get('life'):
-                    report_lines.append(f"  Life Cover: ${partner_ins['life']:,.0f}")
-                if partner_ins.get('trauma'):
-                    report_lines.append(f"  Trauma Cover: ${partner_ins['trauma']:,.0f}")
-                if partner_ins.get('income_protection'):
-                    report_lines.append(f"  Income Protection: ${partner_ins['income_protection']:,.0f}/month")
-                if partner_ins.get('total_premiums'):
-                    report_lines.append(f"  Current Premiums: ${partner_ins['total_premiums']:,.0f}/month")
-
-            report_lines.append("")
+        existing_insurance = summary.get('existing_insurance')
+        if existing_insurance:
+            write("EXISTING INSURANCE\n")
+            write("-" * 50 + "\n")
+
+            if 'main' in existing_insurance:
+                write("Main Contact:\n")
+                self._write_report_rows(write, existing_insurance['main'], _COVER_ROWS)
+
+            if 'partner' in existing_insurance:
+                write("\nPartner:\n")
+                self._write_report_rows(write, existing_insurance['partner'], _COVER_ROWS)
+
+            write("\n")
 
         # Recommendations Section
-        if summary['recommendations']:
-            report_lines.extend([
-                "RECOMMENDATIONS",
-                "-" * 50
-            ])
-
-            rec = summary['recommendations']
-            if rec.get('selected_provider'):
-                report_lines.append(f"Recommended Provider: {rec['selected_provider']}")
+        rec = summary['recommendations']
+        if rec:
+            write("RECOMMENDATIONS\n")
+            write("-" * 50 + "\n")
+
+            selected_provider = rec.get('selected_provider')
+            if selected_provider:
+                write(f"Recommended Provider: {selected_provider}\n")
             if rec.get('scope_of_advice'):
-                report_lines.append(f"Scope: {', '.join(rec['scope_of_advice'])}")
+                write(f"Scope: {', '.join(rec['scope_of_advice'])}\n")
             if rec.get('limitations'):
-                report_lines.append(f"Limitations: {', '.join(rec['limitations'])}")
+                write(f"Limitations: {', '.join(rec['limitations'])}\n")
 
             if rec.get('quotes'):
-                report_lines.append("\nProvider Quotes:")
+                write("\nProvider Quotes:\n")
                 for provider, quote in sorted(rec['quotes'].items(), key=lambda x: x[1]):
-                    selected = " ← SELECTED" if provider == rec.get('selected_provider') else ""
-                    report_lines.append(f"  {provider:20} ${quote:,.0f}/month{selected}")
+                    selected = " ← SELECTED" if provider == selected_provider else ""
+                    write(f"  {provider:20} {_format_monthly(quote)}{selected}\n")
 
-            report_lines.append("")
+            write("\n")
 
         # Footer
-        report_lines.extend([
-            "=" * 70,
-            "END OF REPORT",
-            "=" * 70
-        ])
+        write("=" * 70 + "\n")
+        write("END OF REPORT\n")
+        write("=" * 70)
+
+    @staticmethod
+    def _write_report_rows(write, values: Dict[str, Any], rows: Tuple[Tuple[str, str, Callable[[Any], str]], ...]):
+        """Write a 'label: value' line for each populated row of a report section"""
+        for label, key, formatter in rows:
+            value = values.get(key)
+            if value:
+                write(f"{label}: {formatter(value)}\n")
 
-        report_content = "\n".join(report_lines)
+    def to_dict(self, include_summary: bool = True) -> Dict[str, Any]:
+        """
+        Export complete workflow data as dictionary
 
-        # Save to file if path provided
-        if output_path:
-            output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            output_file.write_text(report_content)
+        Args:
+            include_summary: Whether to include the computed client summary
 
-        return report_content
+        Returns:
+            Dictionary containing workflow data
+        """
+        data = self._export_data()
+
+        if include_summary:
+            data['client_summary'] = self.get_client_summary()
+
+        return data
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Export complete workflow data as dictionary"""
+    def _export_data(self) -> Dict[str, Any]:
+        """Workflow data and form dictionaries shared by to_dict and to_json"""
         return {
             'workflow_data': self.workflow_data,
             'fact_find': self.fact_find.to_dict() if self.fact_find else None,
-            'automation_form': self.automation_form.to_dict() if self.automation_form else None,
-            'client_summary': self.get_client_summary()
+            'automation_form': self.automation_form.to_dict() if self.automation_form else None
         }
 
-    def to_json(self, indent: int = 2) -> str:
-        """Export complete workflow data as JSON"""
-        return json.dumps(self.to_dict(), indent=indent, default=str)
\ No newline at end of file
+    def to_json(self, indent: int = 2, include_summary: bool = True) -> str:
+        """Export complete workflow data as JSON (uses orjson when available)"""
+        # Serialized straight away, so the cached summary can be used without copying
+        data = self._export_data()
+        if include_summary:
+            data['client_summary'] = self._cached_client_summary()
+
+        # orjson only supports 2-space indentation. Its output matches the stdlib for
+        # ordinary data; it writes NaN/Infinity as null and large floats without the
+        # exponent sign (1e16 vs 1e+16), and rejects ints over 64 bits, which fall back.
+        if _HAS_ORJSON and indent == 2:
+            try:
+                return orjson.dumps(data, option=_ORJSON_EXPORT_OPTIONS, default=str).decode('utf-8')
+            except (orjson.JSONEncodeError, TypeError):
+                pass
+
+        return json.dumps(data, indent=indent, default=str, ensure_ascii=False)
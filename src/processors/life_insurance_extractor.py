@@ -9,121 +9,184 @@ Extracts life insurance information with separate sections for:
 Designed for Zapier consumption with clean, structured data
 """
 
-from typing import Dict, Any, Optional, List
-
-
-def extract_life_insurance(combined_data: Dict[str, Any], is_couple: bool = False) -> Dict[str, Any]:
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
+
+# Gravity Forms field IDs read by the extractors
+_F_LIFE_NEEDS = "504"
+_F_LIFE_MAIN_SUM = "389"
+_F_LIFE_MAIN_EXISTING = "380"
+_F_LIFE_PARTNER_SUM = "400"
+_F_LIFE_PARTNER_EXISTING = "391"
+_F_LIFE_SELECTED = "520.1"
+
+_F_TRAUMA_NEEDS = "506"
+_F_TRAUMA_MAIN_SUM = "409"
+_F_TRAUMA_MAIN_EXISTING = "405"
+_F_TRAUMA_PARTNER_SUM = "418"
+_F_TRAUMA_PARTNER_EXISTING = "414"
+_F_TRAUMA_SELECTED = "520.3"
+
+
+def _clean_currency(value: Any) -> int:
+    """Convert currency values to integer (NZD)"""
+    if not value:
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    return _clean_currency_str(str(value))
+
+
+@lru_cache(maxsize=512)
+def _clean_currency_str(value: str) -> int:
+    """Convert a currency string to integer (cached - amounts repeat heavily across records)"""
+    cleaned = value.replace('$', '').replace(',', '').strip()
+    try:
+        return int(float(cleaned))
+    except (ValueError, OverflowError):
+        return 0
+
+
+def _shortfall(sum_insured: int, existing_cover: int) -> int:
+    """Cover shortfall, floored at zero"""
+    return sum_insured - existing_cover if sum_insured > existing_cover else 0
+
+
+def _format_currency(value: int) -> str:
+    """Format integer as currency string"""
+    return f"${value:,}" if value > 0 else "$0"
+
+
+def _coverage_details(sum_insured: int, existing_cover: int, shortfall: int, is_in_scope: bool) -> Dict[str, Any]:
+    """Build one person's coverage block (shared by the life and trauma extractors)"""
+    return {
+        "sum_insured_nzd": sum_insured,
+        "sum_insured_formatted": _format_currency(sum_insured),
+        "existing_cover_nzd": existing_cover,
+        "existing_cover_formatted": _format_currency(existing_cover),
+        "shortfall_nzd": shortfall,
+        "shortfall_formatted": _format_currency(shortfall),
+        "is_in_scope": is_in_scope
+    }
+
+
+def _extract_insurance(
+    combined_data: Dict[str, Any],
+    is_couple: bool,
+    section_id: str,
+    needs_field: str,
+    main_sum_field: str,
+    main_existing_field: str,
+    partner_sum_field: str,
+    partner_existing_field: str,
+    selected_field: str,
+    selected_values: Tuple[str, ...],
+    context_single: str,
+    context_couple: str
+) -> Dict[str, Any]:
     """
-    Extract life insurance information separating needs analysis from coverage fields.
+    Extract one insurance section (shared by the life and trauma extractors).
+
+    The two extractors only differ in the field IDs they read and the needs
+    analysis wording, which are passed in here.
 
     Args:
         combined_data: Combined fact find and automation form data
         is_couple: Whether this is for a couple (affects structure)
+        section_id: Section identifier, also used as the section_type prefix
+        needs_field: Field ID of the needs analysis narrative
+        main_sum_field: Field ID of the main person's sum insured
+        main_existing_field: Field ID of the main person's existing cover
+        partner_sum_field: Field ID of the partner's sum insured
+        partner_existing_field: Field ID of the partner's existing cover
+        selected_field: Field ID of the scope of advice checkbox
+        selected_values: Checkbox values that mean the cover is in scope
+        context_single: Needs analysis context for a single person
+        context_couple: Needs analysis context for a couple
 
     Returns:
-        Dictionary with life insurance needs analysis and coverage details
+        Dictionary with the section's needs analysis and coverage details
     """
-
-    def safe_get(data: dict, field: str, default: Any = "") -> Any:
-        """Safely get a field value with a default"""
-        return data.get(field, default) if data else default
-
-    def clean_currency(value: Any) -> int:
-        """Convert currency values to integer (NZD)"""
-        if not value or value == "":
-            return 0
-        if isinstance(value, (int, float)):
-            return int(value)
-        cleaned = str(value).replace('$', '').replace(',', '').strip()
-        try:
-            return int(float(cleaned))
-        except:
-            return 0
-
-    def format_currency(value: int) -> str:
-        """Format integer as currency string"""
-        return f"${value:,}" if value > 0 else "$0"
+    data = combined_data or {}
 
     # Extract needs analysis (narrative section)
-    needs_analysis = safe_get(combined_data, "504", "")
+    needs_analysis = data.get(needs_field, "")
 
-    # Main person life insurance fields
-    main_sum_insured = clean_currency(safe_get(combined_data, "389", 0))
-    main_existing_cover = clean_currency(safe_get(combined_data, "380", 0))
-    main_life_insurance_selected = safe_get(combined_data, "520.1", "") == "Life Insurance"
+    # Main person fields
+    main_sum_insured = _clean_currency(data.get(main_sum_field, 0))
+    main_existing_cover = _clean_currency(data.get(main_existing_field, 0))
 
-    # Partner person life insurance fields
-    partner_sum_insured = clean_currency(safe_get(combined_data, "400", 0))
-    partner_existing_cover = clean_currency(safe_get(combined_data, "391", 0))
-    partner_life_insurance_selected = safe_get(combined_data, "520.1", "") == "Life Insurance"
+    # Partner person fields
+    partner_sum_insured = _clean_currency(data.get(partner_sum_field, 0))
+    partner_existing_cover = _clean_currency(data.get(partner_existing_field, 0))
+
+    # The scope checkbox is shared by both people, so it is read once
+    main_selected = partner_selected = data.get(selected_field, "") in selected_values
+
+    # Shortfalls are computed once and reused for the raw and formatted values
+    main_shortfall = _shortfall(main_sum_insured, main_existing_cover)
 
     # Build response based on couple status
     if is_couple:
-        result = {
-            "section_id": "life_insurance",
-            "section_type": "life_insurance_couple",
+        partner_shortfall = _shortfall(partner_sum_insured, partner_existing_cover)
+        return {
+            "section_id": section_id,
+            "section_type": f"{section_id}_couple",
             "scenario": "joint",
             "needs_analysis": {
                 "narrative": needs_analysis,
-                "context": "Cross-ownership business considerations",
+                "context": context_couple,
                 "applies_to": "both_partners"
             },
             "coverage": {
-                "primary": {
-                    "person": "Main Person",
-                    "sum_insured_nzd": main_sum_insured,
-                    "sum_insured_formatted": format_currency(main_sum_insured),
-                    "existing_cover_nzd": main_existing_cover,
-                    "existing_cover_formatted": format_currency(main_existing_cover),
-                    "shortfall_nzd": max(0, main_sum_insured - main_existing_cover),
-                    "shortfall_formatted": format_currency(max(0, main_sum_insured - main_existing_cover)),
-                    "is_in_scope": main_life_insurance_selected
-                },
-                "secondary": {
-                    "person": "Partner",
-                    "sum_insured_nzd": partner_sum_insured,
-                    "sum_insured_formatted": format_currency(partner_sum_insured),
-                    "existing_cover_nzd": partner_existing_cover,
-                    "existing_cover_formatted": format_currency(partner_existing_cover),
-                    "shortfall_nzd": max(0, partner_sum_insured - partner_existing_cover),
-                    "shortfall_formatted": format_currency(max(0, partner_sum_insured - partner_existing_cover)),
-                    "is_in_scope": partner_life_insurance_selected
-                }
-            },
-            "format": {
-                "currency": "NZD",
-                "locale": "en-NZ"
-            }
-        }
-    else:
-        # Single person scenario
-        result = {
-            "section_id": "life_insurance",
-            "section_type": "life_insurance_single",
-            "scenario": "single",
-            "needs_analysis": {
-                "narrative": needs_analysis,
-                "context": "Individual protection needs",
-                "applies_to": "individual"
-            },
-            "coverage": {
-                "person": {
-                    "sum_insured_nzd": main_sum_insured,
-                    "sum_insured_formatted": format_currency(main_sum_insured),
-                    "existing_cover_nzd": main_existing_cover,
-                    "existing_cover_formatted": format_currency(main_existing_cover),
-                    "shortfall_nzd": max(0, main_sum_insured - main_existing_cover),
-                    "shortfall_formatted": format_currency(max(0, main_sum_insured - main_existing_cover)),
-                    "is_in_scope": main_life_insurance_selected
-                }
+                "primary": {"person": "Main Person", **_coverage_details(main_sum_insured, main_existing_cover, main_shortfall, main_selected)},
+                "secondary": {"person": "Partner", **_coverage_details(partner_sum_insured, partner_existing_cover, partner_shortfall, partner_selected)}
             },
-            "format": {
-                "currency": "NZD",
-                "locale": "en-NZ"
-            }
+            "format": {"currency": "NZD", "locale": "en-NZ"}
         }
 
-    return result
+    # Single person scenario
+    return {
+        "section_id": section_id,
+        "section_type": f"{section_id}_single",
+        "scenario": "single",
+        "needs_analysis": {
+            "narrative": needs_analysis,
+            "context": context_single,
+            "applies_to": "individual"
+        },
+        "coverage": {
+            "person": _coverage_details(main_sum_insured, main_existing_cover, main_shortfall, main_selected)
+        },
+        "format": {"currency": "NZD", "locale": "en-NZ"}
+    }
+
+
+def extract_life_insurance(combined_data: Dict[str, Any], is_couple: bool = False) -> Dict[str, Any]:
+    """
+    Extract life insurance information separating needs analysis from coverage fields.
+
+    Args:
+        combined_data: Combined fact find and automation form data
+        is_couple: Whether this is for a couple (affects structure)
+
+    Returns:
+        Dictionary with life insurance needs analysis and coverage details
+    """
+    return _extract_insurance(
+        combined_data,
+        is_couple,
+        "life_insurance",
+        _F_LIFE_NEEDS,
+        _F_LIFE_MAIN_SUM,
+        _F_LIFE_MAIN_EXISTING,
+        _F_LIFE_PARTNER_SUM,
+        _F_LIFE_PARTNER_EXISTING,
+        _F_LIFE_SELECTED,
+        ("Life Insurance",),
+        context_single="Individual protection needs",
+        context_couple="Cross-ownership business considerations"
+    )
 
 
 def extract_trauma_insurance(combined_data: Dict[str, Any], is_couple: bool = False) -> Dict[str, Any]:
@@ -137,101 +200,48 @@ def extract_trauma_insurance(combined_data: Dict[str, Any], is_couple: bool = Fa
     Returns:
         Dictionary with trauma insurance needs analysis and coverage details
     """
+    return _extract_insurance(
+        combined_data,
+        is_couple,
+        "trauma_insurance",
+        _F_TRAUMA_NEEDS,
+        _F_TRAUMA_MAIN_SUM,
+        _F_TRAUMA_MAIN_EXISTING,
+        _F_TRAUMA_PARTNER_SUM,
+        _F_TRAUMA_PARTNER_EXISTING,
+        _F_TRAUMA_SELECTED,
+        ("Trauma Cover", "Trauma"),
+        context_single="Protection against serious illness",
+        context_couple="Protection against serious illness"
+    )
+
+
+def extract_life_insurance_batch(records: List[Dict[str, Any]], is_couple: bool = False) -> List[Dict[str, Any]]:
+    """
+    Extract life insurance information for a batch of records (e.g. a Zapier array post).
 
-    def safe_get(data: dict, field: str, default: Any = "") -> Any:
-        """Safely get a field value with a default"""
-        return data.get(field, default) if data else default
-
-    def clean_currency(value: Any) -> int:
-        """Convert currency values to integer"""
-        if not value or value == "":
-            return 0
-        if isinstance(value, (int, float)):
-            return int(value)
-        cleaned = str(value).replace('$', '').replace(',', '').strip()
-        try:
-            return int(float(cleaned))
-        except:
-            return 0
-
-    def format_currency(value: int) -> str:
-        """Format integer as currency string"""
-        return f"${value:,}" if value > 0 else "$0"
-
-    # Extract needs analysis
-    needs_analysis = safe_get(combined_data, "506", "")
-
-    # Trauma insurance fields
-    main_trauma_sum = clean_currency(safe_get(combined_data, "409", 0))
-    main_trauma_existing = clean_currency(safe_get(combined_data, "405", 0))
-    main_trauma_selected = safe_get(combined_data, "520.3", "") in ["Trauma Cover", "Trauma"]
-
-    partner_trauma_sum = clean_currency(safe_get(combined_data, "418", 0))
-    partner_trauma_existing = clean_currency(safe_get(combined_data, "414", 0))
-    partner_trauma_selected = safe_get(combined_data, "520.3", "") in ["Trauma Cover", "Trauma"]
+    Currency strings are parsed through a shared cache, so amounts repeated
+    across the batch are only cleaned once.
+
+    Args:
+        records: List of combined fact find and automation form data
+        is_couple: Whether the records are for couples
+
+    Returns:
+        List of life insurance results, one per record
+    """
+    return [extract_life_insurance(record, is_couple) for record in records]
 
-    if is_couple:
-        result = {
-            "section_id": "trauma_insurance",
-            "section_type": "trauma_insurance_couple",
-            "scenario": "joint",
-            "needs_analysis": {
-                "narrative": needs_analysis,
-                "context": "Protection against serious illness",
-                "applies_to": "both_partners"
-            },
-            "coverage": {
-                "primary": {
-                    "person": "Main Person",
-                    "sum_insured_nzd": main_trauma_sum,
-                    "sum_insured_formatted": format_currency(main_trauma_sum),
-                    "existing_cover_nzd": main_trauma_existing,
-                    "existing_cover_formatted": format_currency(main_trauma_existing),
-                    "shortfall_nzd": max(0, main_trauma_sum - main_trauma_existing),
-                    "shortfall_formatted": format_currency(max(0, main_trauma_sum - main_trauma_existing)),
-                    "is_in_scope": main_trauma_selected
-                },
-                "secondary": {
-                    "person": "Partner",
-                    "sum_insured_nzd": partner_trauma_sum,
-                    "sum_insured_formatted": format_currency(partner_trauma_sum),
-                    "existing_cover_nzd": partner_trauma_existing,
-                    "existing_cover_formatted": format_currency(partner_trauma_existing),
-                    "shortfall_nzd": max(0, partner_trauma_sum - partner_trauma_existing),
-                    "shortfall_formatted": format_currency(max(0, partner_trauma_sum - partner_trauma_existing)),
-                    "is_in_scope": partner_trauma_selected
-                }
-            },
-            "format": {
-                "currency": "NZD",
-                "locale": "en-NZ"
-            }
-        }
-    else:
-        result = {
-            "section_id": "trauma_insurance",
-            "section_type": "trauma_insurance_single",
-            "scenario": "single",
-            "needs_analysis": {
-                "narrative": needs_analysis,
-                "context": "Protection against serious illness",
-                "applies_to": "individual"
-            },
-            "coverage": {
-                "person": {
-                    "sum_insured_nzd": main_trauma_sum,
-                    "sum_insured_formatted": format_currency(main_trauma_sum),
-                    "existing_cover_nzd": main_trauma_existing,
-                    "existing_cover_formatted": format_currency(main_trauma_existing),
-                    "shortfall_nzd": max(0, main_trauma_sum - main_trauma_existing),
-                    "shortfall_formatted": format_currency(max(0, main_trauma_sum - main_trauma_existing)),
-                    "is_in_scope": main_trauma_selected
-                }
-            },
-            "format": {
-                "currency": "NZD",
-                "locale": "en-NZ"
-            }
-        }
 
-    return result
+def extract_trauma_insurance_batch(records: List[Dict[str, Any]], is_couple: bool = False) -> List[Dict[str, Any]]:
+    """
+    Extract trauma insurance information for a batch of records.
+
+    Args:
+        records: List of combined fact find and automation form data
+        is_couple: Whether the records are for couples
+
+    Returns:
+        List of trauma insurance results, one per record
+    """
+    return [extract_trauma_insurance(record, is_couple) for record in records]
@@ -4,8 +4,160 @@ Extracts personal information as formatted text table for Zapier
 """
 
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+import logging
 import re
+import sys
+
+logger = logging.getLogger(__name__)
+
+# First number in a free-text hours field (e.g. "35+ hours", "about 20 hrs")
+_HOURS_RE = re.compile(r"(\d+(?:\.\d+)?)")
+
+# Lower-cased checkbox/radio values treated as yes or no
+_YES_VALUES = frozenset(("yes", "true", "1"))
+_NO_VALUES = frozenset(("no", "false", "0"))
+
+# Text table layout shared by every result
+_SECTION_RULE = "=" * 60
+_PERSON_RULE = "-" * 40
+_TITLE_LINES = ("PERSONAL INFORMATION", _SECTION_RULE)
+
+# Person row labels in display order, padded to the value column once at import
+_ROW_LABELS = tuple(
+    f"{label:<20} " for label in (
+        "Name:", "Age:", "Occupation:", "Employer:", "Annual Salary:", "Employment Status:", "Will/EPA:"
+    )
+)
+
+# Characters dropped from currency strings before parsing ("$75,000" -> "75000")
+_SALARY_STRIP = str.maketrans("", "", "$, ")
+
+# Gravity Forms field IDs read outside the per-person table. Digit-only literals are
+# usually interned by the compiler already; sys.intern makes that explicit, so every
+# ID used below (including _PERSON_FIELDS) is the one shared string object.
+_F_MAIN_FIRST = sys.intern("144")
+_F_MAIN_FIRST_ALT = sys.intern("first_name")
+_F_MAIN_LAST = sys.intern("145")
+_F_PARTNER_FIRST = sys.intern("146")
+_F_PARTNER_LAST = sys.intern("147")
+_F_COUPLE_HINTS = (sys.intern("39"), sys.intern("8"))
+_F_PARTNER_SALARY = sys.intern("42")
+
+# Per-person field IDs as (field, (main person IDs, partner IDs)). Where more than
+# one ID is listed, the later ones are only used when the earlier field is absent.
+_PERSON_FIELDS = tuple(
+    (name, tuple(tuple(map(sys.intern, ids)) for ids in person_ids))
+    for name, person_ids in (
+        ("dob", (("94", "95"), ("95",))),
+        ("occupation", (("6",), ("40", "286"))),
+        ("employer", (("277",), ("297", "288"))),
+        ("salary", (("10",), (_F_PARTNER_SALARY, "296"))),
+        ("self_employed", (("276",), ("483",))),
+        ("hours", (("275",), ("295",))),
+        ("will", (("26",), ("300",))),
+    )
+)
+
+
+def _first(data: dict, fields: tuple, default: Any = "") -> Any:
+    """Get the first of several fields that is present, with a default"""
+    for field in fields:
+        if field in data:
+            return data[field]
+    return default
+
+
+def _lower(value: Any) -> str:
+    """Lower-case a form answer, skipping str() for values that are already strings"""
+    if isinstance(value, str):
+        return value.lower() if value else value
+    return str(value).lower()
+
+
+def _safe_int(value: Any, default: int = 0) -> int:
+    """Convert to integer, handling currency strings"""
+    if not value:
+        return default
+    if isinstance(value, (int, float)):
+        return max(0, int(value))
+    cleaned = str(value).translate(_SALARY_STRIP).strip()
+    if not cleaned:
+        return default
+    try:
+        return max(0, int(float(cleaned)))
+    except (ValueError, OverflowError):
+        return default
+
+
+def _format_currency(value: int) -> str:
+    """Format as currency"""
+    return f"${value:,}" if value > 0 else "$0"
+
+
+@lru_cache(maxsize=4096)
+def _parse_dob(dob_string: str) -> Optional[date]:
+    """Parse a date of birth string (cached - the same DOBs recur across requests)"""
+    # Fast paths for the common fixed-width shapes; anything else falls back to strptime
+    if len(dob_string) == 10:
+        try:
+            if dob_string[4] == '-' and dob_string[7] == '-':
+                year, month, day = dob_string[:4], dob_string[5:7], dob_string[8:]
+                if year.isdecimal() and month.isdecimal() and day.isdecimal():
+                    return date(int(year), int(month), int(day))
+            elif dob_string[2] == '/' and dob_string[5] == '/':
+                first, second, year = dob_string[:2], dob_string[3:5], dob_string[6:]
+                if first.isdecimal() and second.isdecimal() and year.isdecimal():
+                    # Month-first is tried before day-first, as in the strptime order below
+                    if int(first) <= 12:
+                        return date(int(year), int(first), int(second))
+                    return date(int(year), int(second), int(first))
+        except ValueError:
+            pass
+    elif len(dob_string) == 19 and dob_string[10] in ' T' and dob_string[13] == ':' and dob_string[16] == ':':
+        # Form timestamps ("2025-10-30 01:13:38") - fromisoformat is implemented in C
+        try:
+            return datetime.fromisoformat(dob_string).date()
+        except ValueError:
+            pass
+
+    for fmt in ("%m/%d/%Y", "%Y-%m-%d", "%d/%m/%Y", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
+        try:
+            return datetime.strptime(dob_string, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _calculate_age(dob_string: str, today: date) -> int:
+    """Calculate age on the given date from a date of birth string"""
+    if not dob_string or not isinstance(dob_string, str):
+        return 0
+    dob = _parse_dob(dob_string)
+    if dob is None:
+        return 0
+    return today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
+
+
+def _get_employment_status(is_self_employed: bool, hours: Any) -> str:
+    """Determine employment status"""
+    if is_self_employed:
+        return "Self-Employed"
+    if hours:
+        try:
+            hours_num = float(hours)
+        except (TypeError, ValueError, OverflowError):
+            # Free text such as "35+ hours" - use the first number in it
+            match = _HOURS_RE.search(str(hours))
+            if not match:
+                return "Fulltime"
+            hours_num = float(match.group(1))
+        if hours_num >= 30:
+            return "Fulltime"
+        elif hours_num > 0:
+            return "Part-time"
+    return "Fulltime"
 
 
 def extract_personal_information(combined_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -13,177 +165,95 @@ def extract_personal_information(combined_data: Dict[str, Any]) -> Dict[str, Any
     Extract personal information as a formatted text table
     Single text field for Zapier instead of parsed JSON
     """
+    if not combined_data:
+        return dict(_EMPTY_RESULT)
+    return _render_personal_information(combined_data)
 
-    def safe_get(data: dict, field: str, default: Any = "") -> Any:
-        """Safely get a field value with a default"""
-        return data.get(field, default) if data else default
-
-    def safe_int(value: Any, default: int = 0) -> int:
-        """Convert to integer, handling currency strings"""
-        if not value or value == "":
-            return default
-        if isinstance(value, (int, float)):
-            return max(0, int(value))
-        cleaned = str(value).replace(', ', '').replace(',', '').strip()
-        try:
-            return max(0, int(float(cleaned)))
-        except:
-            return default
-
-    def format_currency(value: int) -> str:
-        """Format as currency"""
-        return f"${value:,}" if value > 0 else "$0"
-
-    def calculate_age(dob_string: str) -> int:
-        """Calculate age from date of birth string"""
-        if not dob_string or dob_string == "":
-            return 0
-        try:
-            for fmt in ["%m/%d/%Y", "%Y-%m-%d", "%d/%m/%Y", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"]:
-                try:
-                    dob = datetime.strptime(dob_string, fmt)
-                    today = datetime.now()
-                    age = today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
-                    return int(age)
-                except ValueError:
-                    continue
-            return 0
-        except:
-            return 0
-
-    def get_employment_status(is_self_employed: bool, hours_field: str, combined_data: Dict) -> str:
-        """Determine employment status"""
-        if is_self_employed:
-            return "Self-Employed"
-        hours = safe_get(combined_data, hours_field, "")
-        if hours:
-            try:
-                hours_num = float(hours)
-                if hours_num >= 30:
-                    return "Fulltime"
-                elif hours_num > 0:
-                    return "Part-time"
-            except:
-                pass
-        return "Fulltime"
+
+def _render_personal_information(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Render the personal information table for non-empty form data"""
 
     # Build text table for personal information
-    lines = []
-    lines.append("PERSONAL INFORMATION")
-    lines.append("=" * 60)
+    lines = list(_TITLE_LINES)
 
-    # Main person information
-    main_first = safe_get(combined_data, "144") or safe_get(combined_data, "first_name") or ""
-    main_last = safe_get(combined_data, "145", "")
+    # Main person and partner names (the partner's name also marks a couple)
+    main_first = data.get(_F_MAIN_FIRST) or data.get(_F_MAIN_FIRST_ALT) or ""
+    main_last = data.get(_F_MAIN_LAST, "")
     main_name = f"{main_first} {main_last}".strip() or "Main Person"
 
-    main_age = calculate_age(safe_get(combined_data, "94", safe_get(combined_data, "95", "")))
-    main_occupation = safe_get(combined_data, "6", "")
-    main_employer = safe_get(combined_data, "277", "")
-    main_salary = safe_int(safe_get(combined_data, "10", 0))
-
-    # Check if self-employed
-    main_self_employed = str(safe_get(combined_data, "276", "")).lower() in ['yes', 'true', '1']
-    if main_self_employed:
-        main_employer = "Self-Employed"
-
-    main_status = get_employment_status(main_self_employed, "275", combined_data)
-
-    # Will/EPA status
-    will_status = safe_get(combined_data, "26", "")
-    if str(will_status).lower() in ['yes', 'true', '1']:
-        will_text = "In Place"
-    elif str(will_status).lower() in ['no', 'false', '0']:
-        will_text = "Not In Place"
-    else:
-        will_text = "Not Specified"
-
-    # Add main person to table
-    lines.append("")
-    lines.append("Main Person:")
-    lines.append("-" * 40)
-    lines.append(f"Name:                {main_name}")
-    if main_age > 0:
-        lines.append(f"Age:                 {main_age} years")
-    if main_occupation:
-        lines.append(f"Occupation:          {main_occupation}")
-    if main_employer:
-        lines.append(f"Employer:            {main_employer}")
-    if main_salary > 0:
-        lines.append(f"Annual Salary:       {format_currency(main_salary)}")
-    lines.append(f"Employment Status:   {main_status}")
-    lines.append(f"Will/EPA:            {will_text}")
-
-    # Check for partner
-    partner_first = safe_get(combined_data, "146", "")
-    partner_last = safe_get(combined_data, "147", "")
+    partner_first = data.get(_F_PARTNER_FIRST, "")
+    partner_last = data.get(_F_PARTNER_LAST, "")
 
     # Determine if couple
     is_couple = bool(partner_first or partner_last)
     if not is_couple:
-        # Also check couple indicators
-        couple_field = str(safe_get(combined_data, "39", safe_get(combined_data, "8", ""))).lower()
-        if 'couple' in couple_field or 'partner' in couple_field:
-            is_couple = True
+        # Also check couple indicators (usually blank for single clients)
+        couple_field = _first(data, _F_COUPLE_HINTS)
+        if couple_field:
+            couple_field = _lower(couple_field)
+            is_couple = 'couple' in couple_field or 'partner' in couple_field
 
+    today = date.today()
+    people = [(0, "Main Person:", main_name)]
     if is_couple:
         partner_name = f"{partner_first} {partner_last}".strip() or "Partner"
-        partner_age = calculate_age(safe_get(combined_data, "95", ""))
-        partner_occupation = safe_get(combined_data, "40", safe_get(combined_data, "286", ""))
-        partner_employer = safe_get(combined_data, "297", safe_get(combined_data, "288", ""))
-        partner_salary = safe_int(safe_get(combined_data, "42", safe_get(combined_data, "296", 0)))
-
-        # Check if partner is self-employed
-        partner_self_employed = str(safe_get(combined_data, "483", "")).lower() in ['yes', 'true', '1']
-        if partner_self_employed:
-            partner_employer = "Self-Employed"
-
-        partner_status = get_employment_status(partner_self_employed, "295", combined_data)
-
-        # Partner Will/EPA status
-        partner_will = safe_get(combined_data, "300", "")
-        if str(partner_will).lower() in ['yes', 'true', '1']:
-            partner_will_text = "In Place"
-        elif str(partner_will).lower() in ['no', 'false', '0']:
-            partner_will_text = "Not In Place"
+        people.append((1, "Partner:", partner_name))
+
+    main_salary = 0
+    for person, heading, name in people:
+        fields = {field: _first(data, ids[person]) for field, ids in _PERSON_FIELDS}
+
+        age = _calculate_age(fields["dob"], today)
+        occupation = fields["occupation"]
+        employer = fields["employer"]
+        salary = _safe_int(fields["salary"])
+        if person == 0:
+            main_salary = salary
+
+        # Check if self-employed
+        self_employed = _lower(fields["self_employed"]) in _YES_VALUES
+        if self_employed:
+            employer = "Self-Employed"
+
+        status = _get_employment_status(self_employed, fields["hours"])
+
+        # Will/EPA status
+        will_status = _lower(fields["will"])
+        if will_status in _YES_VALUES:
+            will_text = "In Place"
+        elif will_status in _NO_VALUES:
+            will_text = "Not In Place"
         else:
-            partner_will_text = "Not Specified"
-
-        # Add partner to table
-        lines.append("")
-        lines.append("Partner:")
-        lines.append("-" * 40)
-        lines.append(f"Name:                {partner_name}")
-        if partner_age > 0:
-            lines.append(f"Age:                 {partner_age} years")
-        if partner_occupation:
-            lines.append(f"Occupation:          {partner_occupation}")
-        if partner_employer:
-            lines.append(f"Employer:            {partner_employer}")
-        if partner_salary > 0:
-            lines.append(f"Annual Salary:       {format_currency(partner_salary)}")
-        lines.append(f"Employment Status:   {partner_status}")
-        lines.append(f"Will/EPA:            {partner_will_text}")
+            will_text = "Not Specified"
+
+        # Add person to table (rows with a blank value are left out), in _ROW_LABELS order
+        values = (
+            name,
+            f"{age} years" if age > 0 else None,
+            occupation,
+            employer,
+            _format_currency(salary) if salary > 0 else None,
+            status,
+            will_text,
+        )
+        lines += ("", heading, _PERSON_RULE)
+        lines.extend(f"{label}{value}" for label, value in zip(_ROW_LABELS, values) if value)
 
     # Add summary
-    lines.append("")
-    lines.append("=" * 60)
-    total_income = main_salary + (safe_int(safe_get(combined_data, "42", 0)) if is_couple else 0)
+    lines += ("", _SECTION_RULE)
+    total_income = main_salary + (_safe_int(data.get(_F_PARTNER_SALARY, 0)) if is_couple else 0)
     if total_income > 0:
-        lines.append(f"Combined Annual Income: {format_currency(total_income)}")
+        lines.append(f"Combined Annual Income: {_format_currency(total_income)}")
 
     # Create the final text block
     personal_info_text = "\n".join(lines)
 
     # Debug output
-    print("=" * 50)
-    print("PERSONAL INFORMATION EXTRACTION")
-    print("=" * 50)
-    print(f"Is Couple: {is_couple}")
-    print(f"Main Name: {main_name}")
-    print(f"Partner Name: {partner_name if is_couple else 'N/A'}")
-    print(f"Text Length: {len(personal_info_text)} chars")
-    print("=" * 50)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Personal information extraction: couple=%s main=%s partner=%s length=%d chars",
+            is_couple, main_name, partner_name if is_couple else "N/A", len(personal_info_text)
+        )
 
     return {
         "section_id": "personal_information",
@@ -191,3 +261,7 @@ def extract_personal_information(combined_data: Dict[str, Any]) -> Dict[str, Any
         "is_couple": is_couple,
         "status": "success"
     }
+
+
+# Empty or missing form data always renders the same placeholder table
+_EMPTY_RESULT = _render_personal_information({})
@@ -14,26 +14,110 @@ Author: Insurance SOA System
 License: Lighthouse Financial
 """
 
-import json
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, repeat
+from types import MappingProxyType
+
+# Sentinel for "field not present" (a present field may legitimately hold None)
+_MISSING = object()
+
+
+# Lower-cased checkbox markers for explicit TRUE / FALSE values
+_TRUTHY_MARKERS = frozenset(('yes', 'true', '1', 'checked', 'on', 'x'))
+_FALSY_MARKERS = frozenset(('no', 'false', '0', 'unchecked', 'off'))
+
+# Common raw spellings of the markers ("Yes", "YES", "no", ...) matched before normalising
+_TRUTHY_VARIANTS = frozenset(v for m in _TRUTHY_MARKERS for v in (m, m.upper(), m.capitalize()))
+_FALSY_VARIANTS = frozenset(v for m in _FALSY_MARKERS for v in (m, m.upper(), m.capitalize()))
+
+
+def _is_checked(value: Any) -> bool:
+    """Convert various checkbox representations to boolean"""
+    # Dispatch on the exact type first - checkbox values are almost always str or bool
+    value_type = type(value)
+    if value_type is bool:
+        return value
+
+    if value_type is not str and not isinstance(value, str):
+        if value is None or value == "":
+            return False
+        return bool(value)
+
+    # Usual spellings are matched as-is, without allocating normalised copies
+    if value in _TRUTHY_VARIANTS:
+        return True
+    if value in _FALSY_VARIANTS:
+        return False
+
+    value_lower = value.lower().strip()
+    # Check for explicit TRUE checkbox markers
+    if value_lower in _TRUTHY_MARKERS:
+        return True
+    # Check for explicit FALSE checkbox markers
+    if value_lower in _FALSY_MARKERS:
+        return False
+    # If it's a non-empty string not in the above lists, treat as selected
+    # (covers cases where form stores product names or descriptions in checkbox fields)
+    return len(value_lower) > 0
+
+
+class Limitation(NamedTuple):
+    """An active scope limitation reason"""
+    code: str
+    description: str
+
+
+@lru_cache(maxsize=256)
+def _limitations_content(active_limitations: Tuple[Limitation, ...], limitation_notes: str) -> str:
+    """Build the limitations section text (cached - only 127 limitation combinations exist)"""
+    limitations_text = "; ".join([lim.description for lim in active_limitations])
+
+    if limitation_notes:
+        return f"Scope limitations: {limitations_text}. Additional notes: {limitation_notes}"
+
+    return f"Scope limitations: {limitations_text}"
+
+
+def _parse_wp_datetime(date_str: str) -> datetime:
+    """Parse a WordPress timestamp, trying the C fromisoformat parser before strptime"""
+    if (len(date_str) == 19 and date_str[4] == '-' and date_str[7] == '-'
+            and date_str[10] == ' ' and date_str[13] == ':' and date_str[16] == ':'):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+
+
+@lru_cache(maxsize=1024)
+def _format_wp_date(date_str: str) -> Optional[str]:
+    """Format a WordPress timestamp as 'Day, DD Month YYYY' (cached - batches share submission dates)"""
+    try:
+        # Parse WordPress format: "2025-10-30 01:13:38"
+        dt = _parse_wp_datetime(date_str)
+        # Format as "Wednesday, 30 October 2025"
+        return dt.strftime("%A, %d %B %Y")
+    except ValueError:
+        return None
 
 
 class ScopeOfAdviceGenerator:
     """Generator for scope of advice JSON structures"""
 
-    # Insurance product mapping
-    INSURANCE_PRODUCTS = {
+    # Insurance product mapping (class-level mappings are read-only views)
+    INSURANCE_PRODUCTS = MappingProxyType({
         '5.1': 'Life Insurance',
         '5.2': 'Income Protection',
         '5.3': 'Trauma Cover',
         '5.4': 'Health Insurance',
         '5.5': 'Total Permanent Disability (TPD)',
         '5.6': 'ACC Top-Up'
-    }
+    })
 
     # Limitation reasons mapping
-    LIMITATION_REASONS = {
+    LIMITATION_REASONS = MappingProxyType({
         '6.1': 'employer_medical',
         '6.2': 'no_debt_strong_assets',
         '6.3': 'budget_limitations',
@@ -41,10 +125,19 @@ class ScopeOfAdviceGenerator:
         '6.5': 'no_dependants',
         '6.6': 'uninsurable_occupation',
         '6.7': 'other'
-    }
+    })
+
+    # (prefixed key, field ID, name) triples iterated on every generation, built once
+    _SCOPE_KEYS = tuple((f"f{field_id}", field_id, name) for field_id, name in INSURANCE_PRODUCTS.items())
+    _LIMITATION_KEYS = tuple((f"f{field_id}", field_id, code) for field_id, code in LIMITATION_REASONS.items())
+
+    # Every form key the generator reads; forms with none of them produce the default result
+    _FORM_FIELD_KEYS = frozenset(chain.from_iterable(
+        keys[:2] for keys in _SCOPE_KEYS + _LIMITATION_KEYS
+    )) | {'f7', '7', 'date_created'}
 
     # Human-readable limitation descriptions
-    LIMITATION_DESCRIPTIONS = {
+    LIMITATION_DESCRIPTIONS = MappingProxyType({
         'employer_medical': 'Medical cover provided through employer',
         'no_debt_strong_assets': 'No debt and strong asset base eliminates need for life cover',
         'budget_limitations': 'Budget constraints limit insurance options',
@@ -52,18 +145,28 @@ class ScopeOfAdviceGenerator:
         'no_dependants': 'No financial dependants requiring protection',
         'uninsurable_occupation': 'Occupation is not insurable or has significant loadings',
         'other': 'Other reasons (see notes)'
-    }
+    })
+
+    # One shared Limitation per reason in checkbox order, resolved once (immutable, safe to reuse)
+    _LIMITATION_DETAILS = tuple(map(
+        Limitation,
+        LIMITATION_REASONS.values(),
+        map(LIMITATION_DESCRIPTIONS.get, LIMITATION_REASONS.values(), repeat('Unknown limitation'))
+    ))
 
     # Map limitations to commonly affected products
-    LIMITATION_TO_PRODUCTS_MAP = {
-        'employer_medical': ['Health Insurance'],
-        'no_debt_strong_assets': ['Life Insurance'],
-        'budget_limitations': ['all'],  # Can affect any product
-        'self_insure': ['Income Protection', 'Trauma Cover', 'Health Insurance'],
-        'no_dependants': ['Life Insurance'],
-        'uninsurable_occupation': ['Income Protection', 'Total Permanent Disability (TPD)'],
-        'other': ['all']  # Can affect any product
-    }
+    LIMITATION_TO_PRODUCTS_MAP = MappingProxyType({
+        'employer_medical': ('Health Insurance',),
+        'no_debt_strong_assets': ('Life Insurance',),
+        'budget_limitations': ('all',),  # Can affect any product
+        'self_insure': ('Income Protection', 'Trauma Cover', 'Health Insurance'),
+        'no_dependants': ('Life Insurance',),
+        'uninsurable_occupation': ('Income Protection', 'Total Permanent Disability (TPD)'),
+        'other': ('all',)  # Can affect any product
+    })
+
+    # Checkbox parsing is a plain module function; kept reachable as cls._is_checked
+    _is_checked = staticmethod(_is_checked)
 
     @classmethod
     def generate_scope_json(cls,
@@ -87,23 +190,23 @@ class ScopeOfAdviceGenerator:
         Returns:
             Structured JSON containing raw data, processed scope, and prose generation context
         """
-        # Extract and process form fields
-        scope_fields = cls._extract_scope_fields(raw_form_data)
-        limitation_fields = cls._extract_limitation_fields(raw_form_data)
+        # Fast path: nothing ticked, no notes and no date - every product is out of scope
+        if raw_form_data.keys().isdisjoint(cls._FORM_FIELD_KEYS):
+            return {
+                "section_type": "scope_of_advice",
+                "products_in_scope": [],
+                "products_out_of_scope": list(cls.INSURANCE_PRODUCTS.values()),
+                "sections": {
+                    "limitations": cls._generate_limitations_content([], "")
+                }
+            }
+
+        # Extract form fields - the checkboxes are decoded once per flag combination
+        flags = cls._read_checkbox_flags(raw_form_data)
+        in_scope, out_of_scope, active_limitations = _decode_checkbox_flags(flags)
         limitation_notes = cls._extract_limitation_notes(raw_form_data)
         form_submission_date = cls._extract_and_format_date(raw_form_data)
 
-        # Determine in-scope and out-of-scope products
-        in_scope, out_of_scope = cls._process_scope(scope_fields)
-
-        # Process limitation reasons
-        active_limitations = cls._process_limitations(limitation_fields)
-
-        # Map limitations to out-of-scope products
-        limitation_product_mapping = cls._map_limitations_to_products(
-            active_limitations, out_of_scope
-        )
-
         # Build the lean JSON structure - only essential fields for Zapier
         sections = {
             "limitations": cls._generate_limitations_content(
@@ -117,46 +220,61 @@ class ScopeOfAdviceGenerator:
 
         return {
             "section_type": "scope_of_advice",
-            "products_in_scope": in_scope,
-            "products_out_of_scope": out_of_scope,
+            "products_in_scope": list(in_scope),
+            "products_out_of_scope": list(out_of_scope),
             "sections": sections
         }
 
     @classmethod
-    def _get_field_value(cls, data: Dict[str, Any], field_id: str) -> Optional[Any]:
-        """Extract field value trying both with and without 'f' prefix"""
-        # Try with 'f' prefix first
-        f_key = f"f{field_id}"
-        if f_key in data:
-            return data[f_key]
-
-        # Try without prefix
-        if field_id in data:
-            return data[field_id]
+    def generate_scope_json_batch(cls,
+                                 raw_forms: List[Dict[str, Any]],
+                                 client_name: Optional[str] = None,
+                                 is_couple: bool = False) -> List[Dict[str, Any]]:
+        """
+        Generate scope of advice JSON for a batch of forms (e.g. a Zapier array post)
 
-        return None
+        Forms with the same limitation pattern share the cached limitations text, and
+        forms without any scope fields take the default-result fast path.
 
-    @classmethod
-    def _extract_scope_fields(cls, data: Dict[str, Any]) -> Dict[str, bool]:
-        """Extract scope checkbox fields and convert to boolean values"""
-        scope_fields = {}
+        Args:
+            raw_forms: List of raw form data dicts from Gravity Forms
+            client_name: Optional client name for personalization
+            is_couple: Whether the forms are for couples
 
-        for field_id, product_name in cls.INSURANCE_PRODUCTS.items():
-            value = cls._get_field_value(data, field_id)
-            scope_fields[product_name] = cls._is_checked(value)
+        Returns:
+            List of scope of advice JSON structures, one per form
+        """
+        generate = cls.generate_scope_json
+        return [generate(raw_form_data, client_name, is_couple) for raw_form_data in raw_forms]
 
-        return scope_fields
+    @classmethod
+    def _get_field_value(cls, data: Dict[str, Any], field_id: str) -> Optional[Any]:
+        """Extract field value trying both with and without 'f' prefix"""
+        # Try with 'f' prefix first, then without
+        value = data.get(f"f{field_id}", _MISSING)
+        if value is _MISSING:
+            value = data.get(field_id)
+        return value
 
     @classmethod
-    def _extract_limitation_fields(cls, data: Dict[str, Any]) -> Dict[str, bool]:
-        """Extract limitation checkbox fields and convert to boolean values"""
-        limitation_fields = {}
+    def _read_checkbox_flags(cls, data: Dict[str, Any]) -> int:
+        """
+        Pack the scope and limitation checkboxes into a single int
 
-        for field_id, reason_code in cls.LIMITATION_REASONS.items():
-            value = cls._get_field_value(data, field_id)
-            limitation_fields[reason_code] = cls._is_checked(value)
+        One bit per checkbox, most significant first: the six scope bits sit above the
+        seven limitation bits, in _SCOPE_KEYS then _LIMITATION_KEYS order.
+        """
+        flags = 0
+        get = data.get
+        is_checked = _is_checked
 
-        return limitation_fields
+        for f_key, field_id, _name in chain(cls._SCOPE_KEYS, cls._LIMITATION_KEYS):
+            value = get(f_key, _MISSING)
+            if value is _MISSING:
+                value = get(field_id)
+            flags = (flags << 1) | is_checked(value)
+
+        return flags
 
     @classmethod
     def _extract_limitation_notes(cls, data: Dict[str, Any]) -> str:
@@ -171,90 +289,7 @@ class ScopeOfAdviceGenerator:
         if not date_str:
             return None
 
-        try:
-            # Parse WordPress format: "2025-10-30 01:13:38"
-            dt = datetime.strptime(str(date_str), "%Y-%m-%d %H:%M:%S")
-            # Format as "Wednesday, 30 October 2025"
-            return dt.strftime("%A, %d %B %Y")
-        except (ValueError, TypeError):
-            return None
-
-    @classmethod
-    def _is_checked(cls, value: Any) -> bool:
-        """Convert various checkbox representations to boolean"""
-        if value is None or value == "":
-            return False
-
-        if isinstance(value, bool):
-            return value
-
-        if isinstance(value, str):
-            value_lower = value.lower().strip()
-            # Check for explicit TRUE checkbox markers
-            if value_lower in ['yes', 'true', '1', 'checked', 'on', 'x']:
-                return True
-            # Check for explicit FALSE checkbox markers
-            if value_lower in ['no', 'false', '0', 'unchecked', 'off']:
-                return False
-            # If it's a non-empty string not in the above lists, treat as selected
-            # (covers cases where form stores product names or descriptions in checkbox fields)
-            return len(value_lower) > 0
-
-        return bool(value)
-
-    @classmethod
-    def _process_scope(cls, scope_fields: Dict[str, bool]) -> Tuple[List[str], List[str]]:
-        """Determine which products are in scope and out of scope"""
-        in_scope = []
-        out_of_scope = []
-
-        for product, is_selected in scope_fields.items():
-            if is_selected:
-                in_scope.append(product)
-            else:
-                out_of_scope.append(product)
-
-        return in_scope, out_of_scope
-
-    @classmethod
-    def _process_limitations(cls, limitation_fields: Dict[str, bool]) -> List[Dict[str, str]]:
-        """Process active limitations into structured format"""
-        active_limitations = []
-
-        for reason_code, is_active in limitation_fields.items():
-            if is_active:
-                active_limitations.append({
-                    'code': reason_code,
-                    'description': cls.LIMITATION_DESCRIPTIONS.get(
-                        reason_code, 'Unknown limitation'
-                    )
-                })
-
-        return active_limitations
-
-    @classmethod
-    def _map_limitations_to_products(cls,
-                                    active_limitations: List[Dict[str, str]],
-                                    out_of_scope: List[str]) -> Dict[str, List[str]]:
-        """Map active limitations to out-of-scope products"""
-        mapping = {}
-
-        for limitation in active_limitations:
-            code = limitation['code']
-            affected_products = cls.LIMITATION_TO_PRODUCTS_MAP.get(code, [])
-
-            # Filter to only include products that are actually out of scope
-            if 'all' in affected_products:
-                # This limitation can affect all products
-                relevant_products = out_of_scope
-            else:
-                # Only include products that are both affected and out of scope
-                relevant_products = [p for p in affected_products if p in out_of_scope]
-
-            if relevant_products:
-                mapping[code] = relevant_products
-
-        return mapping
+        return _format_wp_date(str(date_str))
 
     @classmethod
     def _generate_opening_statement(cls, in_scope: List[str], out_of_scope: List[str]) -> str:
@@ -268,26 +303,24 @@ class ScopeOfAdviceGenerator:
 
     @classmethod
     def _generate_limitation_explanations(cls,
-                                         active_limitations: List[Dict[str, str]],
+                                         active_limitations: List[Limitation],
                                          limitation_mapping: Dict[str, List[str]],
                                          limitation_notes: str) -> List[str]:
         """Generate explanations for each limitation"""
         explanations = []
 
         for limitation in active_limitations:
-            code = limitation['code']
-            description = limitation['description']
+            code, description = limitation
             affected_products = limitation_mapping.get(code, [])
 
             if affected_products:
                 products_str = ", ".join(affected_products)
-                explanation = f"{description} - affecting: {products_str}"
 
                 # Add notes for 'other' reason
                 if code == 'other' and limitation_notes:
-                    explanation += f" (Details: {limitation_notes})"
-
-                explanations.append(explanation)
+                    explanations.append(f"{description} - affecting: {products_str} (Details: {limitation_notes})")
+                else:
+                    explanations.append(f"{description} - affecting: {products_str}")
 
         return explanations
 
@@ -325,7 +358,7 @@ class ScopeOfAdviceGenerator:
 
     @classmethod
     def _generate_out_of_scope_content(cls, out_of_scope: List[str],
-                                      active_limitations: List[Dict[str, str]],
+                                      active_limitations: List[Limitation],
                                       limitation_mapping: Dict[str, List[str]]) -> str:
         """Generate content for out-of-scope products section"""
         if not out_of_scope:
@@ -336,18 +369,13 @@ class ScopeOfAdviceGenerator:
         return f"The following products are not included in this advice {reason}: {products_list}. These exclusions are based on factors detailed in the limitations section."
 
     @classmethod
-    def _generate_limitations_content(cls, active_limitations: List[Dict[str, str]],
+    def _generate_limitations_content(cls, active_limitations: List[Limitation],
                                      limitation_notes: str) -> str:
         """Generate content for limitations section"""
         if not active_limitations:
             return "No specific limitations have been identified that restrict the scope of insurance advice."
 
-        limitations_text = "; ".join([lim['description'] for lim in active_limitations])
-
-        if limitation_notes:
-            limitations_text += f". Additional notes: {limitation_notes}"
-
-        return f"Scope limitations: {limitations_text}"
+        return _limitations_content(tuple(active_limitations), limitation_notes)
 
     @classmethod
     def _generate_assumptions_content(cls, in_scope: List[str], out_of_scope: List[str],
@@ -369,7 +397,7 @@ class ScopeOfAdviceGenerator:
 
     @classmethod
     def _generate_client_priorities_content(cls, in_scope: List[str],
-                                          active_limitations: List[Dict[str, str]],
+                                          active_limitations: List[Limitation],
                                           is_couple: bool) -> str:
         """Generate content for client priorities section"""
         priorities = []
@@ -382,7 +410,7 @@ class ScopeOfAdviceGenerator:
             priorities.append("access to private healthcare")
 
         # Add budget priority if budget limitation exists
-        if any(lim['code'] == 'budget_limitations' for lim in active_limitations):
+        if any(lim.code == 'budget_limitations' for lim in active_limitations):
             priorities.append("keep premiums within budget constraints")
 
         if not priorities:
@@ -442,7 +470,7 @@ class ScopeOfAdviceGenerator:
     def _generate_example_prose(cls,
                                in_scope: List[str],
                                out_of_scope: List[str],
-                               active_limitations: List[Dict[str, str]],
+                               active_limitations: List[Limitation],
                                limitation_notes: str,
                                client_name: Optional[str],
                                is_couple: bool) -> str:
@@ -450,31 +478,28 @@ class ScopeOfAdviceGenerator:
         client_ref = client_name or "the client"
         pronoun = "their" if is_couple else "your"
 
-        prose_parts = []
-
         # Opening
-        prose_parts.append("## Scope of Advice\n")
+        prose_parts = ["## Scope of Advice\n"]
 
         # In-scope products
         if in_scope:
-            prose_parts.append(f"Following our comprehensive needs analysis, we will be providing recommendations for the following insurance products:\n")
-            for product in in_scope:
-                prose_parts.append(f"• {product}")
+            prose_parts.append("Following our comprehensive needs analysis, we will be providing recommendations for the following insurance products:\n")
+            prose_parts.extend([f"• {product}" for product in in_scope])
             prose_parts.append("")
 
         # Out-of-scope products and limitations
         if out_of_scope:
             prose_parts.append("\nThe following products are not included in our current recommendations:\n")
-            for product in out_of_scope:
-                prose_parts.append(f"• {product}")
+            prose_parts.extend([f"• {product}" for product in out_of_scope])
 
             if active_limitations:
                 prose_parts.append("\nThis scope has been determined based on the following factors:\n")
-                for limitation in active_limitations:
-                    desc = limitation['description']
-                    if limitation['code'] == 'other' and limitation_notes:
-                        desc += f" - {limitation_notes}"
-                    prose_parts.append(f"• {desc}")
+                prose_parts.extend([
+                    f"• {limitation.description} - {limitation_notes}"
+                    if limitation.code == 'other' and limitation_notes
+                    else f"• {limitation.description}"
+                    for limitation in active_limitations
+                ])
 
         # Closing
         prose_parts.append(f"\nOur recommendations will be tailored to {pronoun} specific needs and circumstances, focusing on providing appropriate coverage within the agreed scope.")
@@ -482,6 +507,31 @@ class ScopeOfAdviceGenerator:
         return "\n".join(prose_parts)
 
 
+@lru_cache(maxsize=8192)
+def _decode_checkbox_flags(flags: int) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[Limitation, ...]]:
+    """Split packed checkbox flags into in-scope, out-of-scope and active limitations (cached - 2^13 combinations)"""
+    scope_keys = ScopeOfAdviceGenerator._SCOPE_KEYS
+    limitation_details = ScopeOfAdviceGenerator._LIMITATION_DETAILS
+    shift = len(scope_keys) + len(limitation_details)
+
+    in_scope = []
+    out_of_scope = []
+    for _f_key, _field_id, product_name in scope_keys:
+        shift -= 1
+        if flags >> shift & 1:
+            in_scope.append(product_name)
+        else:
+            out_of_scope.append(product_name)
+
+    active_limitations = []
+    for limitation in limitation_details:
+        shift -= 1
+        if flags >> shift & 1:
+            active_limitations.append(limitation)
+
+    return tuple(in_scope), tuple(out_of_scope), tuple(active_limitations)
+
+
 def generate_scope_of_advice_json(raw_form_data: Dict[str, Any],
                                  client_name: Optional[str] = None,
                                  is_couple: bool = False) -> Dict[str, Any]:
@@ -501,29 +551,20 @@ def generate_scope_of_advice_json(raw_form_data: Dict[str, Any],
     )
 
 
-# Example usage and testing
-if __name__ == "__main__":
-    # Example form data
-    example_data = {
-        "f5": "checked",
-        "f5.1": "Yes",  # Life Insurance
-        "f5.2": "Yes",  # Income Protection
-        "f5.3": "No",   # Trauma Cover
-        "f5.4": "No",   # Health Insurance
-        "f5.5": "Yes",  # TPD
-        "f5.6": "No",   # ACC
-        "f6": "checked",
-        "f6.1": "Yes",  # Employer medical
-        "f6.3": "Yes",  # Budget limitations
-        "f7": "Client has comprehensive medical coverage through employer's group scheme"
-    }
-
-    # Generate JSON structure
-    result = generate_scope_of_advice_json(
-        example_data,
-        client_name="John Smith",
-        is_couple=False
-    )
+def generate_scope_of_advice_json_batch(raw_forms: List[Dict[str, Any]],
+                                        client_name: Optional[str] = None,
+                                        is_couple: bool = False) -> List[Dict[str, Any]]:
+    """
+    Generate scope of advice JSON structures for a batch of forms
+
+    Args:
+        raw_forms: List of raw form data dicts from Gravity Forms
+        client_name: Optional client name for personalization
+        is_couple: Whether the forms are for couples
 
-    # Pretty print the result
-    print(json.dumps(result, indent=2))
\ No newline at end of file
+    Returns:
+        List of structured JSON for scope of advice sections
+    """
+    return ScopeOfAdviceGenerator.generate_scope_json_batch(
+        raw_forms, client_name, is_couple
+    )
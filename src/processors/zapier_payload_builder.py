@@ -4,9 +4,206 @@ Creates standardized, consistent payloads for Zapier webhooks
 """
 
 import json
+import logging
+import time
 from typing import Dict, Any, Optional
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON string, using orjson when available"""
+    if _HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode('utf-8')
+
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    # Match orjson's compact output so payloads are identical either way
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (request body), using orjson when available"""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: str) -> Any:
+    """Parse a JSON string, using orjson when available"""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA_PATH = Path(__file__).parent.parent.parent / "config" / "zapier_payload_schema.json"
+
+
+@lru_cache(maxsize=1)
+def _load_schema() -> Optional[Dict[str, Any]]:
+    """Load the Zapier payload schema (cached - read once per process, shared by all builders)"""
+    try:
+        with open(_SCHEMA_PATH, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        # The schema is optional - payloads are built without it
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("Could not load Zapier payload schema: %s", e)
+        return None
+
+
+# Stand-in for a missing report section (read-only, so it can be shared)
+_EMPTY_SECTION = MappingProxyType({})
+
+# Simple payload fields copied from report sections, in payload order:
+# (section, ((payload_key, section_field, default), ...))
+_SECTION_FIELDS = (
+    # === PERSONAL INFORMATION (text format) ===
+    ('personal_information', (
+        ('personal_information', 'personal_information_text', 'No personal information available'),
+    )),
+
+    # === LIFE INSURANCE (consolidated fields) ===
+    ('life_insurance', (
+        ('life_insurance_main', 'life_insurance_main', ''),
+        ('life_insurance_partner', 'life_insurance_partner', ''),
+        ('life_insurance_notes', 'life_insurance_notes', ''),
+    )),
+
+    # === TRAUMA INSURANCE (consolidated fields) ===
+    ('trauma_insurance', (
+        ('trauma_insurance_main', 'trauma_insurance_main', ''),
+        ('trauma_insurance_partner', 'trauma_insurance_partner', ''),
+        ('trauma_insurance_notes', 'trauma_insurance_notes', ''),
+    )),
+
+    # === INCOME PROTECTION (consolidated fields) ===
+    ('income_protection', (
+        ('income_protection_main', 'income_protection_main', ''),
+        ('income_protection_partner', 'income_protection_partner', ''),
+        ('income_protection_notes', 'income_protection_notes', ''),
+    )),
+
+    # === HEALTH INSURANCE (consolidated fields) ===
+    ('health_insurance', (
+        ('health_insurance_main', 'health_insurance_main', ''),
+        ('health_insurance_partner', 'health_insurance_partner', ''),
+        ('health_insurance_notes', 'health_insurance_notes', ''),
+    )),
+
+    # === ACCIDENTAL INJURY (consolidated fields) ===
+    ('accidental_injury', (
+        ('accidental_injury_main', 'accidental_injury_main', ''),
+        ('accidental_injury_partner', 'accidental_injury_partner', ''),
+        ('accidental_injury_notes', 'accidental_injury_notes', ''),
+    )),
+
+    # === ASSETS & LIABILITIES (simple string fields) ===
+    ('assets_liabilities', (
+        ('assets_list', 'assets_json', '[]'),
+        ('liabilities_list', 'liabilities_json', '[]'),
+        ('assets_table', 'assets_text', ''),
+        ('liabilities_table', 'liabilities_text', ''),
+        ('financial_summary', 'summary_text', ''),
+        ('total_assets', 'total_assets', 0),
+        ('total_liabilities', 'total_liabilities', 0),
+        ('net_worth', 'net_worth', 0),
+    )),
+
+    # === INSURANCE QUOTES (quote upload URLs) ===
+    ('insurance_quotes', (
+        ('quote_partners_life', 'quote_partners_life', ''),
+        ('quote_fidelity_life', 'quote_fidelity_life', ''),
+        ('quote_aia', 'quote_aia', ''),
+        ('quote_asteron', 'quote_asteron', ''),
+        ('quote_chubb', 'quote_chubb', ''),
+        ('quote_nib', 'quote_nib', ''),
+        ('quotes_count', 'quotes_count', 0),
+        ('has_quotes', 'has_quotes', False),
+    )),
+)
+
+
+# Fields checked by validate_payload, in the order errors are reported
+_REQUIRED_FIELDS = ('client_email', 'client_name', 'case_id', 'is_couple')
+_TEXT_FIELDS = (
+    'personal_information',
+    'life_insurance_main', 'life_insurance_partner', 'life_insurance_notes',
+    'trauma_insurance_main', 'trauma_insurance_partner', 'trauma_insurance_notes',
+    'income_protection_main', 'income_protection_partner', 'income_protection_notes',
+    'health_insurance_main', 'health_insurance_partner', 'health_insurance_notes',
+    'accidental_injury_main', 'accidental_injury_partner', 'accidental_injury_notes'
+)
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+_TEXT_FIELD_SET = frozenset(_TEXT_FIELDS)
+
+# Last formatted payload timestamp as [epoch_second, iso_string]
+_TS_CACHE = [None, ""]
+
+
+def _payload_timestamp() -> str:
+    """Current local time in ISO format at second resolution (formatted once per second)"""
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[:] = [now, datetime.fromtimestamp(now).isoformat()]
+    return _TS_CACHE[1]
+
+
+# (label, payload field) pairs listed by get_payload_summary
+_SUMMARY_SECTIONS = (
+    ('Personal Information', 'personal_information'),
+    ('Life Insurance (Main)', 'life_insurance_main'),
+    ('Life Insurance (Partner)', 'life_insurance_partner'),
+    ('Life Insurance (Notes)', 'life_insurance_notes'),
+    ('Trauma Insurance (Main)', 'trauma_insurance_main'),
+    ('Trauma Insurance (Partner)', 'trauma_insurance_partner'),
+    ('Trauma Insurance (Notes)', 'trauma_insurance_notes'),
+    ('Income Protection (Main)', 'income_protection_main'),
+    ('Income Protection (Partner)', 'income_protection_partner'),
+    ('Income Protection (Notes)', 'income_protection_notes'),
+    ('Health Insurance (Main)', 'health_insurance_main'),
+    ('Health Insurance (Partner)', 'health_insurance_partner'),
+    ('Health Insurance (Notes)', 'health_insurance_notes'),
+    ('Accidental Injury (Main)', 'accidental_injury_main'),
+    ('Accidental Injury (Partner)', 'accidental_injury_partner'),
+    ('Accidental Injury (Notes)', 'accidental_injury_notes'),
+)
+
+
+def _scope_status(scope_data: Any) -> str:
+    """Status of a scope_of_advice_json value for the payload summary"""
+    # Empty sections carry the shared placeholder - no need to parse it
+    if scope_data == _NOT_GENERATED_JSON:
+        return 'not_generated'
+
+    try:
+        scope_obj = _loads(scope_data) if scope_data else {}
+        return scope_obj.get('status', 'present') if scope_obj else 'missing'
+    except Exception:
+        return 'present' if scope_data else 'missing'
+
+
+# Placeholder for sections that have not been generated (serialized once)
+_NOT_GENERATED_JSON = _dumps({
+    "status": "not_generated",
+    "message": "Section data not yet generated"
+})
 
 
 class ZapierPayloadBuilder:
@@ -17,14 +214,11 @@ class ZapierPayloadBuilder:
     preventing field mismatches and errors in Zapier workflows.
     """
 
+    __slots__ = ('schema',)
+
     def __init__(self):
         """Initialize the payload builder with schema"""
-        schema_path = Path(__file__).parent.parent.parent / "config" / "zapier_payload_schema.json"
-        try:
-            with open(schema_path, 'r') as f:
-                self.schema = json.load(f)
-        except:
-            self.schema = None
+        self.schema = _load_schema()
 
     def build_payload(self, combined_report: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -36,81 +230,50 @@ class ZapierPayloadBuilder:
         Returns:
             Standardized payload with guaranteed field structure
         """
-        # Extract core fields with fallbacks
-        client_email = combined_report.get('email', '')
-        client_name = combined_report.get('client_name', 'Unknown Client')
-        case_id = combined_report.get('case_id', '')
-        is_couple = combined_report.get('is_couple', False)
+        get = combined_report.get
 
         # Build the standardized payload - ONLY simple fields + JSON strings for Zapier
         payload = {
             # === CORE IDENTIFICATION (simple fields) ===
-            "client_email": client_email,
-            "client_name": client_name,
-            "partner_name": combined_report.get('partner_name', None),
-            "case_id": case_id,
-            "is_couple": is_couple,
-            "match_confidence": combined_report.get('match_confidence', 0.0),
+            "client_email": get('email', ''),
+            "client_name": get('client_name', 'Unknown Client'),
+            "partner_name": get('partner_name', None),
+            "case_id": get('case_id', ''),
+            "is_couple": get('is_couple', False),
+            "match_confidence": get('match_confidence', 0.0),
 
             # === JSON STRING FIELDS (one field per section - no nested objects!) ===
-            "scope_of_advice_json": self._build_section_json(combined_report.get('scope_of_advice', {})),
-
-            # === PERSONAL INFORMATION (text format) ===
-            "personal_information": combined_report.get('personal_information', {}).get('personal_information_text', 'No personal information available'),
-
-            # === LIFE INSURANCE (consolidated fields) ===
-            "life_insurance_main": combined_report.get('life_insurance', {}).get('life_insurance_main', ''),
-            "life_insurance_partner": combined_report.get('life_insurance', {}).get('life_insurance_partner', ''),
-            "life_insurance_notes": combined_report.get('life_insurance', {}).get('life_insurance_notes', ''),
-
-            # === TRAUMA INSURANCE (consolidated fields) ===
-            "trauma_insurance_main": combined_report.get('trauma_insurance', {}).get('trauma_insurance_main', ''),
-            "trauma_insurance_partner": combined_report.get('trauma_insurance', {}).get('trauma_insurance_partner', ''),
-            "trauma_insurance_notes": combined_report.get('trauma_insurance', {}).get('trauma_insurance_notes', ''),
-
-            # === INCOME PROTECTION (consolidated fields) ===
-            "income_protection_main": combined_report.get('income_protection', {}).get('income_protection_main', ''),
-            "income_protection_partner": combined_report.get('income_protection', {}).get('income_protection_partner', ''),
-            "income_protection_notes": combined_report.get('income_protection', {}).get('income_protection_notes', ''),
-
-            # === HEALTH INSURANCE (consolidated fields) ===
-            "health_insurance_main": combined_report.get('health_insurance', {}).get('health_insurance_main', ''),
-            "health_insurance_partner": combined_report.get('health_insurance', {}).get('health_insurance_partner', ''),
-            "health_insurance_notes": combined_report.get('health_insurance', {}).get('health_insurance_notes', ''),
-
-            # === ACCIDENTAL INJURY (consolidated fields) ===
-            "accidental_injury_main": combined_report.get('accidental_injury', {}).get('accidental_injury_main', ''),
-            "accidental_injury_partner": combined_report.get('accidental_injury', {}).get('accidental_injury_partner', ''),
-            "accidental_injury_notes": combined_report.get('accidental_injury', {}).get('accidental_injury_notes', ''),
-
-            # === ASSETS & LIABILITIES (simple string fields) ===
-            "assets_list": combined_report.get('assets_liabilities', {}).get('assets_json', '[]'),
-            "liabilities_list": combined_report.get('assets_liabilities', {}).get('liabilities_json', '[]'),
-            "assets_table": combined_report.get('assets_liabilities', {}).get('assets_text', ''),
-            "liabilities_table": combined_report.get('assets_liabilities', {}).get('liabilities_text', ''),
-            "financial_summary": combined_report.get('assets_liabilities', {}).get('summary_text', ''),
-            "total_assets": combined_report.get('assets_liabilities', {}).get('total_assets', 0),
-            "total_liabilities": combined_report.get('assets_liabilities', {}).get('total_liabilities', 0),
-            "net_worth": combined_report.get('assets_liabilities', {}).get('net_worth', 0),
-
-            # === INSURANCE QUOTES (quote upload URLs) ===
-            "quote_partners_life": combined_report.get('insurance_quotes', {}).get('quote_partners_life', ''),
-            "quote_fidelity_life": combined_report.get('insurance_quotes', {}).get('quote_fidelity_life', ''),
-            "quote_aia": combined_report.get('insurance_quotes', {}).get('quote_aia', ''),
-            "quote_asteron": combined_report.get('insurance_quotes', {}).get('quote_asteron', ''),
-            "quote_chubb": combined_report.get('insurance_quotes', {}).get('quote_chubb', ''),
-            "quote_nib": combined_report.get('insurance_quotes', {}).get('quote_nib', ''),
-            "quotes_count": combined_report.get('insurance_quotes', {}).get('quotes_count', 0),
-            "has_quotes": combined_report.get('insurance_quotes', {}).get('has_quotes', False),
-
-            # === METADATA ===
-            "timestamp": datetime.now().isoformat(),
-            "source": "Insurance-SOA-System",
-            "payload_version": "1.1"
+            "scope_of_advice_json": self._build_section_json(get('scope_of_advice', _EMPTY_SECTION)),
         }
 
+        # Section fields - each section dict is looked up once
+        for section_name, fields in _SECTION_FIELDS:
+            section_get = get(section_name, _EMPTY_SECTION).get
+            for payload_key, field, default in fields:
+                payload[payload_key] = section_get(field, default)
+
+        # === METADATA ===
+        payload["timestamp"] = _payload_timestamp()
+        payload["source"] = "Insurance-SOA-System"
+        payload["payload_version"] = "1.1"
+
         return payload
 
+    def serialize_payload(self, payload: Dict[str, Any]) -> bytes:
+        """
+        Serialize a built payload to a JSON request body in a single pass
+
+        The *_json fields are already strings, so they are encoded as-is rather
+        than being parsed and re-serialized.
+
+        Args:
+            payload: A payload returned by build_payload
+
+        Returns:
+            UTF-8 encoded JSON bytes
+        """
+        return _dumps_bytes(payload)
+
     def _ensure_section(self, section_data: Any, default: Dict[str, Any]) -> Dict[str, Any]:
         """
         Ensure a section has data, or return a default empty structure
@@ -122,37 +285,32 @@ class ZapierPayloadBuilder:
         Returns:
             Valid section data or default structure
         """
-        if not isinstance(section_data, dict):
+        if type(section_data) is not dict or not section_data:
             return default
 
-        if not section_data or len(section_data) == 0:
-            return default
-
-        # Ensure status is set
+        # Ensure status is set - on a copy, so the caller's report is not mutated
         if 'status' not in section_data:
-            section_data['status'] = 'success'
+            return {**section_data, 'status': 'success'}
 
         return section_data
 
-    def _build_section_json(self, section_data: Dict[str, Any]) -> str:
+    def _build_section_json(self, section_data: Dict[str, Any], pretty: bool = False) -> str:
         """
         Build a single JSON string field for any insurance section
         for easy Zapier mapping (one field instead of many nested objects)
 
         Args:
             section_data: The insurance section data from combined report
+            pretty: Indent the JSON for manual debugging (Zapier only needs it compact)
 
         Returns:
             JSON string containing all data, or empty object string if not generated
         """
         if not isinstance(section_data, dict) or not section_data:
-            return json.dumps({
-                "status": "not_generated",
-                "message": "Section data not yet generated"
-            })
+            return _NOT_GENERATED_JSON
 
         # If data exists, return it as a JSON string
-        return json.dumps(section_data, indent=2)
+        return _dumps(section_data, indent=pretty)
 
     def validate_payload(self, payload: Dict[str, Any]) -> tuple[bool, list]:
         """
@@ -166,14 +324,11 @@ class ZapierPayloadBuilder:
         """
         errors = []
 
-        # Check required simple fields
-        required_fields = [
-            'client_email', 'client_name', 'case_id', 'is_couple'
-        ]
-
-        for field in required_fields:
-            if field not in payload:
-                errors.append(f"Missing required field: {field}")
+        # Check required simple fields (reported in _REQUIRED_FIELDS order)
+        missing = _REQUIRED_FIELD_SET - payload.keys()
+        if missing:
+            errors.extend([f"Missing required field: {field}"
+                           for field in _REQUIRED_FIELDS if field in missing])
 
         # Check required JSON field (only scope of advice remains as JSON)
         if 'scope_of_advice_json' not in payload:
@@ -182,18 +337,10 @@ class ZapierPayloadBuilder:
             errors.append("Field 'scope_of_advice_json' must be a JSON string")
 
         # Check text fields exist (don't need to validate content - can be empty)
-        text_sections = [
-            'personal_information',
-            'life_insurance_main', 'life_insurance_partner', 'life_insurance_notes',
-            'trauma_insurance_main', 'trauma_insurance_partner', 'trauma_insurance_notes',
-            'income_protection_main', 'income_protection_partner', 'income_protection_notes',
-            'health_insurance_main', 'health_insurance_partner', 'health_insurance_notes',
-            'accidental_injury_main', 'accidental_injury_partner', 'accidental_injury_notes'
-        ]
-
-        for field in text_sections:
-            if field not in payload:
-                errors.append(f"Missing text field: {field}")
+        missing = _TEXT_FIELD_SET - payload.keys()
+        if missing:
+            errors.extend([f"Missing text field: {field}"
+                           for field in _TEXT_FIELDS if field in missing])
 
         # Check types
         if 'is_couple' in payload and not isinstance(payload['is_couple'], bool):
@@ -224,41 +371,25 @@ class ZapierPayloadBuilder:
 
         # Check scope of advice (JSON)
         scope_data = payload.get('scope_of_advice_json', '')
-        try:
-            scope_obj = json.loads(scope_data) if scope_data else {}
-            scope_status = scope_obj.get('status', 'present') if scope_obj else 'missing'
-        except:
-            scope_status = 'present' if scope_data else 'missing'
+        scope_status = _scope_status(scope_data)
         summary_lines.append(f"  - Scope of Advice: {scope_status} ({len(scope_data)} chars)")
 
         # Check text sections
-        text_sections = [
-            ('Personal Information', 'personal_information'),
-            ('Life Insurance (Main)', 'life_insurance_main'),
-            ('Life Insurance (Partner)', 'life_insurance_partner'),
-            ('Life Insurance (Notes)', 'life_insurance_notes'),
-            ('Trauma Insurance (Main)', 'trauma_insurance_main'),
-            ('Trauma Insurance (Partner)', 'trauma_insurance_partner'),
-            ('Trauma Insurance (Notes)', 'trauma_insurance_notes'),
-            ('Income Protection (Main)', 'income_protection_main'),
-            ('Income Protection (Partner)', 'income_protection_partner'),
-            ('Income Protection (Notes)', 'income_protection_notes'),
-            ('Health Insurance (Main)', 'health_insurance_main'),
-            ('Health Insurance (Partner)', 'health_insurance_partner'),
-            ('Health Insurance (Notes)', 'health_insurance_notes'),
-            ('Accidental Injury (Main)', 'accidental_injury_main'),
-            ('Accidental Injury (Partner)', 'accidental_injury_partner'),
-            ('Accidental Injury (Notes)', 'accidental_injury_notes'),
-        ]
-
-        for label, field in text_sections:
-            text_data = payload.get(field, '')
-            status = 'present' if text_data else 'empty'
-            summary_lines.append(f"  - {label}: {status} ({len(text_data)} chars)")
+        get = payload.get
+        append = summary_lines.append
+        for label, field in _SUMMARY_SECTIONS:
+            text_data = get(field, '')
+            append(f"  - {label}: {'present' if text_data else 'empty'} ({len(text_data)} chars)")
 
         return "\n".join(summary_lines)
 
 
+@lru_cache(maxsize=1)
+def _default_builder() -> ZapierPayloadBuilder:
+    """Shared builder for the module-level helpers (the builder holds no per-report state)"""
+    return ZapierPayloadBuilder()
+
+
 def build_standardized_payload(combined_report: Dict[str, Any]) -> Dict[str, Any]:
     """
     Helper function to build a standardized payload
@@ -269,8 +400,7 @@ def build_standardized_payload(combined_report: Dict[str, Any]) -> Dict[str, Any
     Returns:
         Standardized Zapier payload
     """
-    builder = ZapierPayloadBuilder()
-    return builder.build_payload(combined_report)
+    return _default_builder().build_payload(combined_report)
 
 
 if __name__ == "__main__":
@@ -291,7 +421,7 @@ if __name__ == "__main__":
     payload = builder.build_payload(test_report)
 
     print("Generated Payload:")
-    print(json.dumps(payload, indent=2))
+    print(_dumps(payload, indent=True))
 
     is_valid, errors = builder.validate_payload(payload)
     print(f"\nValidation: {'PASS' if is_valid else 'FAIL'}")
@@ -4,13 +4,53 @@ Automatically sends combined insurance data to Zapier when forms are matched
 """
 
 import json
+import logging
+import random
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional
 import time
 from datetime import datetime
 from processors.zapier_payload_builder import ZapierPayloadBuilder
 
+logger = logging.getLogger(__name__)
+
+# Shared keep-alive connection pool, so repeat triggers reuse the connection to Zapier
+# (retries are handled by ZapierTrigger.trigger, not the adapter)
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=0))
+
+# Background workers for trigger_async, created on first use so importing this
+# module (or only using the blocking trigger) never spins up a thread pool
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared background executor, creating it if needed"""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='zapier-trigger')
+        return _EXECUTOR
+
+
+def shutdown_executor(wait: bool = True) -> None:
+    """
+    Shut down the background executor used by ZapierTrigger.trigger_async
+
+    Args:
+        wait: Block until queued webhooks have been sent
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        executor, _EXECUTOR = _EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
 
 class ZapierTrigger:
     """Handles sending data to Zapier webhooks"""
@@ -23,7 +63,9 @@ class ZapierTrigger:
         self.config = self._load_config(config_path)
         self.enabled = self.config.get('enabled', False)
         self.webhook_url = self.config.get('zapier_webhook_url', '')
+        self.verbose = self.config.get('verbose', False)
         self.payload_builder = ZapierPayloadBuilder()
+        self.session = _SESSION
 
     def _load_config(self, config_path: Path) -> Dict:
         """Load Zapier configuration"""
@@ -31,7 +73,7 @@ class ZapierTrigger:
             with open(config_path, 'r') as f:
                 return json.load(f)
         except Exception as e:
-            print(f"Warning: Could not load Zapier config: {e}")
+            logger.warning("Could not load Zapier config: %s", e)
             return {
                 'enabled': False,
                 'zapier_webhook_url': '',
@@ -41,65 +83,6 @@ class ZapierTrigger:
                 'headers': {'Content-Type': 'application/json'}
             }
 
-    def _flatten_data(self, data: Dict[str, Any], parent_key: str = '', sep: str = '_') -> Dict[str, Any]:
-        """
-        Flatten nested dictionaries for Zapier compatibility.
-        Converts nested structures to flat key-value pairs like:
-        personal_information_main_contact_name instead of data['personal_information']['main_contact']['name']
-
-        Args:
-            data: The data to flatten
-            parent_key: The parent key for recursion
-            sep: Separator between keys
-
-        Returns:
-            Flattened dictionary
-        """
-        items = []
-        for k, v in data.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-
-            # Skip scope_of_advice sections field - only keep limitations and products
-            if parent_key == 'scope_of_advice' and k == 'sections':
-                # Extract only limitations, in_scope, and out_of_scope from sections
-                if isinstance(v, dict):
-                    if 'limitations' in v:
-                        items.append((f"{parent_key}{sep}sections{sep}limitations", v['limitations']))
-                    if 'in_scope' in v:
-                        items.append((f"{parent_key}{sep}products_in_scope", v['in_scope']))
-                    if 'out_of_scope' in v:
-                        items.append((f"{parent_key}{sep}products_out_of_scope", v['out_of_scope']))
-                continue
-
-            # For personal_information, create table format
-            if k in ['personal_information']:
-                if isinstance(v, dict):
-                    # Create a flat table representation
-                    table_data = []
-                    for field_name, field_value in v.items():
-                        if field_name != 'section_type':
-                            table_data.append({
-                                'field': field_name,
-                                'value': str(field_value)
-                            })
-                    items.append((new_key, json.dumps(table_data)))
-                    # Also add section_type
-                    if 'section_type' in v:
-                        items.append((f"{new_key}{sep}section_type", v['section_type']))
-                continue
-
-            if isinstance(v, dict):
-                # Recursively flatten nested dicts
-                items.extend(self._flatten_data(v, new_key, sep=sep).items())
-            elif isinstance(v, (list, tuple)):
-                # For lists, convert to JSON string so Zapier can handle it
-                items.append((new_key, json.dumps(v)))
-            else:
-                # Keep scalar values as-is
-                items.append((new_key, v))
-
-        return dict(items)
-
     def trigger(self, combined_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Send combined data to Zapier webhook
@@ -120,20 +103,16 @@ class ZapierTrigger:
 
         if not self.enabled:
             response['message'] = 'Zapier trigger is disabled'
-            print("📌 Zapier trigger disabled - skipping webhook")
+            logger.info("📌 Zapier trigger disabled - skipping webhook")
             return response
 
         if not self.webhook_url or self.webhook_url == 'YOUR_ZAPIER_WEBHOOK_URL_HERE':
             response['status'] = 'not_configured'
             response['message'] = 'Zapier webhook URL not configured'
-            print("⚠️ Zapier webhook URL not configured")
+            logger.warning("⚠️ Zapier webhook URL not configured")
             return response
 
-        print("=" * 70)
-        print("🚀 TRIGGERING ZAPIER WEBHOOK")
-        print("=" * 70)
-        print(f"URL: {self.webhook_url}")
-        print(f"Data fields: {len(combined_data)} fields")
+        logger.info("🚀 Triggering Zapier webhook: %s (%d data fields)", self.webhook_url, len(combined_data))
 
         # Build standardized payload
         payload = self.payload_builder.build_payload(combined_data)
@@ -141,30 +120,33 @@ class ZapierTrigger:
         # Validate payload
         is_valid, errors = self.payload_builder.validate_payload(payload)
         if not is_valid:
-            print("⚠️ WARNING: Payload validation errors:")
-            for error in errors:
-                print(f"  - {error}")
+            logger.warning("⚠️ Payload validation errors: %s", "; ".join(errors))
         else:
-            print("✅ Payload validation passed")
+            logger.debug("✅ Payload validation passed")
 
-        # Print summary
-        print("\nPayload Summary:")
-        print(self.payload_builder.get_payload_summary(payload))
+        # Log summary (debugging aid - enable with "verbose" in the Zapier config)
+        if self.verbose and logger.isEnabledFor(logging.INFO):
+            logger.info("Payload Summary:\n%s", self.payload_builder.get_payload_summary(payload))
 
         # Try to send with retries
         attempts = self.config.get('retry_attempts', 3)
         retry_delay = self.config.get('retry_delay_seconds', 5)
         timeout = self.config.get('timeout_seconds', 30)
         headers = self.config.get('headers', {'Content-Type': 'application/json'})
+        if 'Content-Type' not in headers:
+            headers = {**headers, 'Content-Type': 'application/json'}
+
+        # Serialize once - every retry posts the same body
+        body = self.payload_builder.serialize_payload(payload)
 
         for attempt in range(1, attempts + 1):
             try:
-                print(f"Attempt {attempt}/{attempts}...")
+                logger.debug("Attempt %d/%d...", attempt, attempts)
 
                 # Send the webhook
-                r = requests.post(
+                r = self.session.post(
                     self.webhook_url,
-                    json=payload,
+                    data=body,
                     headers=headers,
                     timeout=timeout
                 )
@@ -178,39 +160,60 @@ class ZapierTrigger:
                         'status_code': r.status_code,
                         'response_text': r.text[:500] if r.text else None
                     }
-                    print(f"✅ Success! Zapier responded with status {r.status_code}")
+                    logger.info("✅ Success! Zapier responded with status %s", r.status_code)
                     break
                 else:
                     error_msg = f'Zapier returned status {r.status_code}: {r.text[:200]}'
-                    print(f"⚠️ {error_msg}")
+                    logger.warning("⚠️ %s", error_msg)
                     response['message'] = error_msg
                     response['status'] = 'error'
 
+                    # Client errors won't succeed on retry (except request timeout / rate limiting)
+                    if 400 <= r.status_code < 500 and r.status_code not in (408, 429):
+                        break
+
                     if attempt < attempts:
-                        print(f"Retrying in {retry_delay} seconds...")
-                        time.sleep(retry_delay)
+                        # Exponential backoff with jitter: retry_delay, 2x, 4x, ...
+                        delay = retry_delay * (2 ** (attempt - 1)) + random.uniform(0, 0.5)
+                        logger.info("Retrying in %.1f seconds...", delay)
+                        time.sleep(delay)
 
             except requests.exceptions.Timeout:
                 error_msg = f'Request timed out after {timeout} seconds'
-                print(f"⏱️ {error_msg}")
+                logger.warning("⏱️ %s", error_msg)
                 response['message'] = error_msg
                 response['status'] = 'timeout'
 
             except requests.exceptions.RequestException as e:
                 error_msg = f'Request failed: {str(e)}'
-                print(f"❌ {error_msg}")
+                logger.error("❌ %s", error_msg)
                 response['message'] = error_msg
                 response['status'] = 'error'
 
             except Exception as e:
                 error_msg = f'Unexpected error: {str(e)}'
-                print(f"💥 {error_msg}")
+                logger.exception("💥 %s", error_msg)
                 response['message'] = error_msg
                 response['status'] = 'error'
 
-        print("=" * 70)
         return response
 
+    def trigger_async(self, combined_data: Dict[str, Any]) -> Future:
+        """
+        Send combined data to Zapier webhook in the background
+
+        The webhook (including retries) runs on a worker thread, so the caller
+        is not blocked for up to retry_attempts x timeout_seconds. Call
+        shutdown_executor() before exiting to flush queued webhooks.
+
+        Args:
+            combined_data: The combined report data to send
+
+        Returns:
+            Future resolving to the same response data as trigger()
+        """
+        return _get_executor().submit(self.trigger, combined_data)
+
 
 def test_zapier_trigger():
     """Test the Zapier trigger with sample data"""
@@ -255,4 +258,5 @@ def test_zapier_trigger():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     test_zapier_trigger()
\ No newline at end of file
@@ -6,6 +6,7 @@ Receives form submissions and processes them through the Insurance SOA system
 from flask import Flask, request, jsonify
 from pathlib import Path
 import json
+import logging
 import sys
 import os
 from datetime import datetime
@@ -784,6 +785,9 @@ def generate_trauma_insurance_analysis():
 
 
 if __name__ == '__main__':
+    # Show processor log messages (e.g. Zapier trigger progress) on the console
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     print("=" * 70)
     print("INSURANCE SOA WEBHOOK SERVER")
     print("=" * 70)
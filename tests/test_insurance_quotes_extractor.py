@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test script for the Insurance Quotes Extractor
+Tests URL extraction from JSON strings, plain URLs and pre-parsed upload data
+"""
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+
+from processors.insurance_quotes_extractor import extract_quote_url, extract_insurance_quotes
+
+
+def test_extract_quote_url():
+    """Test quote URL extraction for each supported field format"""
+    url = "https://example.com/quotes/aia.pdf"
+
+    # JSON string from Gravity Forms
+    assert extract_quote_url(f'[{{"name":"aia.pdf","url":"{url}"}}]') == url
+
+    # Plain URL string
+    assert extract_quote_url(url) == url
+
+    # Already-parsed list and dict
+    assert extract_quote_url([{"name": "aia.pdf", "url": url}]) == url
+    assert extract_quote_url({"name": "aia.pdf", "url": url}) == url
+
+    # Empty / unusable values
+    assert extract_quote_url("") == ""
+    assert extract_quote_url(None) == ""
+    assert extract_quote_url([]) == ""
+    assert extract_quote_url(["not-a-dict"]) == ""
+    assert extract_quote_url("not json") == ""
+
+
+def test_extract_insurance_quotes():
+    """Test quote counting across provider fields"""
+    result = extract_insurance_quotes({
+        "42": "https://example.com/quotes/partners_life.pdf",
+        "44": [{"name": "aia.pdf", "url": "https://example.com/quotes/aia.pdf"}],
+        "45": ""
+    })
+
+    assert result["quote_partners_life"] == "https://example.com/quotes/partners_life.pdf"
+    assert result["quote_aia"] == "https://example.com/quotes/aia.pdf"
+    assert result["quote_asteron"] == ""
+    assert result["quotes_count"] == 2
+    assert result["has_quotes"] is True
+
+
+if __name__ == "__main__":
+    test_extract_quote_url()
+    test_extract_insurance_quotes()
+    print("✅ All insurance quote extractor tests passed!")
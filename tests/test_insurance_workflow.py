@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for Insurance Workflow
+Tests JSON export parity with and without orjson, and client summary caching
+"""
+import sys
+import os
+from datetime import date, datetime
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+
+from processors import insurance_workflow
+from processors.insurance_workflow import InsuranceWorkflow
+
+
+def test_to_json_matches_stdlib():
+    """Test that the orjson and stdlib to_json paths produce the same output"""
+    print("=" * 70)
+    print("INSURANCE WORKFLOW JSON EXPORT TEST")
+    print("=" * 70)
+
+    workflow = InsuranceWorkflow()
+    workflow.load_fact_find({
+        "f516": "CASE-2024-001",
+        "f144": "Zoë",
+        "f145": "Müller",
+        "f219": "zoe.muller@email.com",
+        "f10": "120000"
+    })
+    workflow.workflow_data['reviewed_at'] = datetime(2025, 1, 27, 9, 30, 15)
+    workflow.workflow_data['review_date'] = date(2025, 1, 27)
+    workflow.workflow_data['premiums_by_year'] = {1: 850.0, 2: 900.5}
+
+    orjson_output = workflow.to_json()
+
+    has_orjson = insurance_workflow._HAS_ORJSON
+    insurance_workflow._HAS_ORJSON = False
+    try:
+        stdlib_output = workflow.to_json()
+    finally:
+        insurance_workflow._HAS_ORJSON = has_orjson
+
+    print(f"orjson available: {has_orjson}")
+    print(f"Output length: {len(stdlib_output)} chars")
+
+    assert '"reviewed_at": "2025-01-27 09:30:15"' in stdlib_output
+    assert '"1": 850.0' in stdlib_output
+    assert 'Zoë' in stdlib_output
+    assert orjson_output == stdlib_output
+
+    # Ints over 64 bits are rejected by orjson and must fall back to the stdlib
+    workflow.workflow_data['policy_reference'] = 2 ** 70
+    oversized_output = workflow.to_json()
+    assert f'"policy_reference": {2 ** 70}' in oversized_output
+
+    insurance_workflow._HAS_ORJSON = False
+    try:
+        assert oversized_output == workflow.to_json()
+    finally:
+        insurance_workflow._HAS_ORJSON = has_orjson
+
+    print("✓ orjson and stdlib exports match")
+
+
+def test_client_summary_cache():
+    """Test that report and JSON export share one summary build, and public copies stay fresh"""
+    print("=" * 70)
+    print("INSURANCE WORKFLOW SUMMARY CACHE TEST")
+    print("=" * 70)
+
+    workflow = InsuranceWorkflow()
+    workflow.load_fact_find({
+        "f144": "John",
+        "f145": "Smith",
+        "f219": "john.smith@email.com"
+    })
+
+    builds = []
+    build_client_summary = InsuranceWorkflow._build_client_summary
+
+    def counting_build(self):
+        builds.append(1)
+        return build_client_summary(self)
+
+    InsuranceWorkflow._build_client_summary = counting_build
+    try:
+        workflow.generate_report()
+        workflow.to_json()
+        assert len(builds) == 1, f"Expected 1 summary build, got {len(builds)}"
+
+        # Reloading a form invalidates the cache
+        workflow.load_fact_find({"f144": "Jane", "f145": "Smith"})
+        assert 'Jane Smith' in workflow.generate_report()
+        assert len(builds) == 2
+    finally:
+        InsuranceWorkflow._build_client_summary = build_client_summary
+
+    # The public summary reflects in-place edits and is safe to modify
+    workflow.fact_find.client_info['email'] = 'jane.smith@email.com'
+    summary = workflow.get_client_summary()
+    assert summary['client_info']['email'] == 'jane.smith@email.com'
+    summary['client_info']['name'] = 'Changed'
+    assert workflow.get_client_summary()['client_info']['name'] == 'Jane Smith'
+
+    print("✓ Summary built once per export and public copies stay fresh")
+
+
+if __name__ == "__main__":
+    test_to_json_matches_stdlib()
+    test_client_summary_cache()
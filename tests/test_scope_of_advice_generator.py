@@ -24,7 +24,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.processors.scope_of_advice_generator import (
     ScopeOfAdviceGenerator,
-    generate_scope_of_advice_json
+    generate_scope_of_advice_json,
+    generate_scope_of_advice_json_batch
 )
 
 
@@ -360,6 +361,19 @@ class TestScopeOfAdviceGenerator(unittest.TestCase):
         self.assertEqual(len(processed["in_scope"]), 0)
         self.assertEqual(len(processed["out_of_scope"]), 6)  # All products out
 
+    def test_batch_generation(self):
+        """Test batch generation matches generating each form on its own"""
+        forms = [self.all_in_scope_data, self.mixed_scope_data, self.no_prefix_data, {}]
+        results = generate_scope_of_advice_json_batch(forms)
+
+        self.assertEqual(len(results), len(forms))
+        for form, result in zip(forms, results):
+            self.assertEqual(result, generate_scope_of_advice_json(form))
+
+        # Empty form takes the fast path but keeps the full structure
+        self.assertEqual(results[3]["products_in_scope"], [])
+        self.assertEqual(len(results[3]["products_out_of_scope"]), 6)
+
     def test_budget_limitations_affect_all(self):
         """Test that budget limitations can affect all products"""
         data = {